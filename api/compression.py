@@ -0,0 +1,53 @@
+# api/compression.py
+
+import gzip
+from functools import wraps
+
+from flask import g, request
+
+
+def revalidated(func):
+    """Mark a handler's JSON GET responses for ETag revalidation and gzip
+
+    Meant for the large historical and heatmap payloads; other responses are
+    sent as they are, without hashing their bodies.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        g.revalidated = True
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def init_response_compression(app, config):
+    """Add weak ETags and gzip compression to responses of ``revalidated`` handlers
+
+    A matching ``If-None-Match`` turns the response into a bodiless 304.
+    Bodies of at least ``GZIP_MIN_SIZE`` bytes are gzipped for clients that
+    accept it. Streamed and already encoded responses are left alone.
+    """
+    min_size = config.GZIP_MIN_SIZE
+
+    @app.after_request
+    def compress_response(response):
+        if (not g.get('revalidated')
+                or request.method != 'GET'
+                or response.status_code != 200
+                or response.mimetype != 'application/json'
+                or response.is_streamed
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers):
+            return response
+
+        response.add_etag(weak=True)
+        response.make_conditional(request)
+        if response.status_code != 200:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        body = response.get_data()
+        if len(body) >= min_size and request.accept_encodings['gzip']:
+            response.set_data(gzip.compress(body, 6))
+            response.headers['Content-Encoding'] = 'gzip'
+        return response
@@ -0,0 +1,17 @@
+# api/converters.py
+
+from werkzeug.routing import BaseConverter
+
+
+class ProcessNameConverter(BaseConverter):
+    """``pname`` URL converter for PM2 process names
+
+    Names outside the pattern never match the route, so they are turned
+    away by the URL map's compiled regex before any handler runs.
+    """
+    regex = r'[A-Za-z0-9_.\-]{1,64}'
+
+
+def init_url_converters(app):
+    """Register the API's URL converters; must run before routes are added"""
+    app.url_map.converters['pname'] = ProcessNameConverter
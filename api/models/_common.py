@@ -0,0 +1,186 @@
+# api/models/_common.py
+
+import sys
+import weakref
+from datetime import datetime
+from collections.abc import Mapping
+from functools import wraps
+
+from flask_restx import fields
+from flask_restx.model import Model, RawModel
+from werkzeug.utils import cached_property
+
+from .serializers import attach_serializers, fast_serializer
+
+
+def _resolve(model):
+    """RawModel.resolved's computation, whether it is a plain or a cached property"""
+    return RawModel.__dict__['resolved'].fget(model)
+
+
+def _build_schema(model):
+    """RawModel._schema's computation"""
+    return RawModel.__dict__['_schema'].fget(model)
+
+
+class CachedModel(Model):
+    """Model that computes ``resolved`` and ``_schema`` once and drops them when it changes
+
+    Marshalling reads ``model.resolved`` for every nested object, and resolving
+    deep-copies the whole field tree. ``_schema`` rebuilds every field's Swagger
+    fragment on each access and is never cached upstream. Every mutating dict
+    method clears both, so a model changed after first use cannot marshal or
+    document stale fields.
+    """
+
+    resolved = cached_property(_resolve, name='resolved', doc=RawModel.resolved.__doc__)
+    _schema = cached_property(_build_schema, name='_schema')
+
+    def _clear_cached(self):
+        self.__dict__.pop('resolved', None)
+        self.__dict__.pop('_schema', None)
+
+
+def _clearing_cache(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._clear_cached()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+for _method in ('__setitem__', '__delitem__', '__ior__', 'clear', 'pop', 'popitem', 'setdefault', 'update'):
+    setattr(CachedModel, _method, _clearing_cache(getattr(dict, _method)))
+del _method
+
+
+def register_model(api, name, model_fields):
+    """Register ``model_fields`` with ``api`` as a CachedModel named ``name``"""
+    return api.add_model(name, CachedModel(name, model_fields))
+
+
+def cached_per_api(factory):
+    """Build a model factory's models once per Api instance and reuse them on later calls
+
+    Each model gets its compiled ``fast_serialize`` function attached when it is built.
+    """
+    cache = weakref.WeakKeyDictionary()
+
+    @wraps(factory)
+    def wrapper(api):
+        cached = cache.get(api)
+        if cached is None:
+            cached = cache[api] = attach_serializers(factory(api))
+        return cached
+
+    return wrapper
+
+
+class EpochMillis(fields.Raw):
+    """Timestamp as integer milliseconds since the Unix epoch"""
+
+    __schema_type__ = 'integer'
+    __schema_format__ = 'int64'
+
+    def format(self, value):
+        if isinstance(value, int):
+            return value
+        try:
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            return int(value.timestamp() * 1000)
+        except (AttributeError, ValueError) as e:
+            raise fields.MarshallingError(e) from e
+
+
+def intern_descriptions(model_fields):
+    """Intern field descriptions so models repeating a label share one string"""
+    for field in model_fields.values():
+        while field is not None:
+            if isinstance(field, fields.Raw) and field.description:
+                field.description = sys.intern(field.description)
+            field = getattr(field, 'container', None)
+    return model_fields
+
+
+@cached_per_api
+def get_monit(api):
+    """Process monitoring stats model, registered once per Api"""
+    return register_model(api, 'ProcessMonitoring', intern_descriptions({
+        'memory': fields.Integer(description='Memory usage in bytes'),
+        'cpu': fields.Float(description='CPU usage percentage'),
+        'timestamp': fields.DateTime(description='Monitoring timestamp')
+    }))
+
+
+class LazyModels(Mapping):
+    """Model table that builds and registers each model on first access
+
+    ``table`` maps a key to ``(name, builder)``. The builder receives this
+    mapping, so models can nest each other by key, and returns either the
+    fields dict for ``register_model(api, name, ...)`` or an already built model.
+    Models without nested fields can give their fields dict directly.
+    """
+
+    def __init__(self, api, table):
+        self.api = api
+        self.table = table
+        self._built = {}
+
+    def __getitem__(self, key):
+        model = self._built.get(key)
+        if model is None:
+            name, builder = self.table[key]
+            model = builder(self) if callable(builder) else builder
+            if not isinstance(model, RawModel):
+                model = register_model(self.api, name, intern_descriptions(model))
+            fast_serializer(model)
+            self._built[key] = model
+        return model
+
+    def __contains__(self, key):
+        return key in self.table
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+    def name_of(self, key):
+        return self.table[key][0]
+
+
+class ModelRegistry(dict):
+    """``Api.models`` replacement that resolves lazy models by key or by name
+
+    Routes look models up by their short key while Swagger looks them up by
+    registered name; either lookup builds the model the first time. Keys must
+    be unique across the tables added.
+    """
+
+    def __init__(self, models=()):
+        super().__init__(models)
+        self.lazy = {}
+
+    def add_lazy(self, models):
+        for key in models:
+            if key in self:
+                raise ValueError(f"Model key {key!r} is already registered")
+            self.lazy[key] = self.lazy[models.name_of(key)] = (models, key)
+
+    def __missing__(self, item):
+        models, key = self.lazy[item]
+        model = models[key]
+        if item == key:
+            self[item] = model
+        return model
+
+    def __contains__(self, item):
+        return dict.__contains__(self, item) or item in self.lazy
+
+    def name_of(self, key):
+        if dict.__contains__(self, key):
+            return self[key].name
+        models, key = self.lazy[key]
+        return models.name_of(key)
@@ -1,15 +1,33 @@
 # /api/models/error.py
 
 from flask_restx import fields
+from core.cache import now_iso
+from ._common import cached_per_api, register_model
 
+
+def error_response(exc, details=None, message=None):
+    """Build an Error model payload for an exception
+
+    Pass ``message`` when the caller already has ``str(exc)``, so it is not
+    formatted again.
+    """
+    return {
+        'error': str(exc) if message is None else message,
+        'error_type': type(exc).__name__,
+        'timestamp': now_iso(),
+        'details': details
+    }
+
+
+@cached_per_api
 def create_error_models(api):
     """Create and register error response models"""
     
-    error_model = api.model('Error', {
+    error_model = register_model(api, 'Error', {
         'error': fields.String(description='Error message'),
         'error_type': fields.String(description='Error type'),
         'timestamp': fields.DateTime(description='Error timestamp'),
         'details': fields.Raw(description='Additional error details')
     })
 
-    return error_model
\ No newline at end of file
+    return error_model
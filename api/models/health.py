@@ -0,0 +1,18 @@
+# api/models/health.py
+
+from flask_restx import fields
+from ._common import LazyModels, cached_per_api
+
+
+@cached_per_api
+def create_health_models(api):
+    """Create models for health checks, built on first use"""
+    return LazyModels(api, {
+        # Health check response model
+        'health': ('HealthCheck', lambda models: {
+            'status': fields.String(description='API status', example='ok'),
+            'version': fields.String(description='API version', example='1.0'),
+            'pm2_status': fields.String(description='PM2 daemon status', example='online'),
+            'processes': fields.Integer(description='Number of running processes', example=3)
+        })
+    })
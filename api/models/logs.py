@@ -0,0 +1,26 @@
+# api/models/logs.py
+
+from flask_restx import fields
+from ._common import LazyModels, cached_per_api
+
+LOG_TYPES = ('error', 'out')
+MAX_LOG_LINES = 10000
+
+
+@cached_per_api
+def create_log_models(api):
+    """Create models for process logs, built on first use"""
+    return LazyModels(api, {
+        # Log request parameters
+        'log_params': ('LogParameters', lambda models: {
+            'logType': fields.String(description='Log type (error/out)', enum=LOG_TYPES, default='out'),
+            'lines': fields.Integer(description='Number of lines to return', default=100, min=1, max=MAX_LOG_LINES)
+        }),
+
+        # Log response model
+        'log_response': ('LogResponse', lambda models: {
+            'logs': fields.List(fields.String, description='Log entries'),
+            'files': fields.Raw(description='Log file information'),
+            'metadata': fields.Raw(description='Log metadata')
+        })
+    })
@@ -1,74 +1,112 @@
 # api/models/monitoring.py
 
 from flask_restx import fields
+from ._common import EpochMillis, LazyModels, cached_per_api, get_monit
 
-def create_monitoring_models(api):
-    """Create models for process monitoring endpoints with heatmap support"""
-    
-    # Base monitoring models (existing)
-    monit_model = api.model('ProcessMonitoring', {
-        'memory': fields.Integer(description='Memory usage in bytes'),
-        'cpu': fields.Float(description='CPU usage percentage'),
-        'timestamp': fields.DateTime(description='Monitoring timestamp')
-    })
-
-    error_model = api.model('ProcessError', {
-        'timestamp': fields.DateTime(description='Error timestamp'),
-        'type': fields.String(description='Error type', enum=['error', 'warning']),
-        'details': fields.Raw(description='Error details')
-    })
+ERROR_TYPES = ('error', 'warning')
 
-    # Heatmap data point model
-    heatmap_point_model = api.model('HeatmapPoint', {
-        'timestamp': fields.DateTime(description='Data point timestamp'),
-        'value': fields.Float(description='Metric value'),
-        'status': fields.String(description='Status color based on thresholds')
-    })
 
-    # Heatmap response model
-    heatmap_model = api.model('Heatmap', {
-        'process_name': fields.String(description='Process name'),
-        'metric_type': fields.String(description='Type of metric (cpu/memory)'),
-        'time_range': fields.String(description='Time range of data'),
-        'interval': fields.String(description='Data aggregation interval'),
-        'thresholds': fields.Raw(description='Color thresholds for values'),
-        'data': fields.List(fields.Nested(heatmap_point_model))
-    })
+@cached_per_api
+def create_monitoring_models(api):
+    """Create models for process monitoring endpoints with heatmap support"""
+    return LazyModels(api, {
+        # Base monitoring models (existing)
+        'monit': ('ProcessMonitoring', lambda models: get_monit(api)),
 
-    # Historical metrics model
-    historical_metrics_model = api.model('HistoricalMetrics', {
-        'process_name': fields.String(description='Process name'),
-        'start_time': fields.DateTime(description='Start of time range'),
-        'end_time': fields.DateTime(description='End of time range'),
-        'interval': fields.String(description='Data aggregation interval'),
-        'metrics': fields.Raw(description='Time series metrics data'),
-        'statistics': fields.Raw(description='Statistical summary')
-    })
+        'process_error': ('ProcessError', lambda models: {
+            'timestamp': fields.DateTime(description='Error timestamp'),
+            'type': fields.String(description='Error type', enum=ERROR_TYPES),
+            'details': fields.Raw(description='Error details')
+        }),
 
-    # Add to existing models
-    base_models = {
-        'monit': monit_model,
-        'error': error_model,
-        'status': api.model('ProcessStatus', {
+        'status': ('ProcessStatus', lambda models: {
             'pid': fields.Integer(description='Process ID'),
             'name': fields.String(description='Process name'),
             'pm_id': fields.Integer(description='PM2 ID'),
-            'monit': fields.Nested(monit_model),
+            'monit': fields.Nested(models['monit']),
             'status': fields.String(description='Process status'),
             'uptime': fields.Integer(description='Process uptime in seconds'),
             'restart_time': fields.Integer(description='Number of restarts'),
             'unstable_restarts': fields.Integer(description='Number of unstable restarts'),
             'created_at': fields.DateTime(description='Process creation timestamp'),
-            'errors': fields.List(fields.Nested(error_model))
+            'errors': fields.List(fields.Nested(models['process_error']))
         }),
-        'metrics': api.model('ProcessMetrics', {
+
+        'metrics': ('ProcessMetrics', lambda models: {
             'process_name': fields.String(description='Process name'),
             'time_range': fields.String(description='Time range of metrics'),
             'metrics': fields.Raw(description='Process metrics data'),
             'summary': fields.Raw(description='Metrics summary')
         }),
-        'heatmap': heatmap_model,
-        'historical': historical_metrics_model
-    }
 
-    return base_models
\ No newline at end of file
+        # Heatmap data point model
+        'heatmap_point': ('HeatmapPoint', lambda models: {
+            'timestamp': fields.DateTime(description='Data point timestamp'),
+            'value': fields.Float(description='Metric value'),
+            'status': fields.String(description='Status color based on thresholds')
+        }),
+
+        # Heatmap color thresholds
+        'threshold': ('HeatmapThreshold', lambda models: {
+            'max': fields.Float(description='Upper bound of the band (none for the last band)'),
+            'color': fields.String(description='Band color')
+        }),
+
+        'thresholds': ('HeatmapThresholds', lambda models: {
+            'low': fields.Nested(models['threshold']),
+            'medium': fields.Nested(models['threshold']),
+            'high': fields.Nested(models['threshold']),
+            'critical': fields.Nested(models['threshold'])
+        }),
+
+        # Heatmap response model
+        'heatmap': ('Heatmap', lambda models: {
+            'process_name': fields.String(description='Process name'),
+            'metric_type': fields.String(description='Type of metric (cpu/memory)'),
+            'time_range': fields.String(description='Time range of data'),
+            'interval': fields.String(description='Data aggregation interval'),
+            'thresholds': fields.Nested(models['thresholds'], description='Color thresholds for values'),
+            'data': fields.List(fields.Nested(models['heatmap_point']))
+        }),
+
+        # Heatmap data as parallel arrays, one entry per point
+        'heatmap_series': ('HeatmapSeries', lambda models: {
+            'timestamps': fields.List(EpochMillis, description='Data point timestamps in epoch milliseconds'),
+            'values': fields.List(fields.Float, description='Metric values'),
+            'status': fields.List(fields.String, description='Status colors based on thresholds')
+        }),
+
+        'heatmap_columnar': ('HeatmapColumnar', lambda models: {
+            'process_name': fields.String(description='Process name'),
+            'metric_type': fields.String(description='Type of metric (cpu/memory)'),
+            'time_range': fields.String(description='Time range of data'),
+            'interval': fields.String(description='Data aggregation interval'),
+            'thresholds': fields.Nested(models['thresholds'], description='Color thresholds for values'),
+            'data': fields.Nested(models['heatmap_series'])
+        }),
+
+        # Historical time series, one list entry per interval
+        'series_stats': ('SeriesStats', lambda models: {
+            'avg': fields.List(fields.Float, description='Average value per interval'),
+            'max': fields.List(fields.Float, description='Maximum value per interval'),
+            'min': fields.List(fields.Float, description='Minimum value per interval')
+        }),
+
+        'historical_data': ('HistoricalData', lambda models: {
+            'timestamps': fields.List(fields.String, description='Interval start times'),
+            'cpu': fields.Nested(models['series_stats'], description='CPU usage percentage'),
+            'memory': fields.Nested(models['series_stats'], description='Memory usage in bytes'),
+            'errors': fields.List(fields.Integer, description='Error count per interval'),
+            'warnings': fields.List(fields.Integer, description='Warning count per interval')
+        }),
+
+        # Historical metrics model
+        'historical': ('HistoricalMetrics', lambda models: {
+            'process_name': fields.String(description='Process name'),
+            'start_time': fields.DateTime(description='Start of time range'),
+            'end_time': fields.DateTime(description='End of time range'),
+            'interval': fields.String(description='Data aggregation interval'),
+            'metrics': fields.Nested(models['historical_data'], description='Time series metrics data'),
+            'statistics': fields.Raw(description='Statistical summary')
+        })
+    })
@@ -0,0 +1,265 @@
+# api/models/serializers.py
+
+import itertools
+from datetime import datetime
+from functools import wraps
+from http import HTTPStatus
+
+import orjson
+from flask import Response, current_app, request
+from flask_restx import fields, marshal
+from flask_restx.fields import MarshallingError
+from flask_restx.mask import Mask
+from flask_restx.model import RawModel
+from flask_restx.utils import merge
+
+from api.representations import encode_json
+
+# Field types whose ``format`` is a plain builtin cast and can be inlined
+_INLINE_CASTS = {
+    fields.String: 'str',
+    fields.Integer: 'int',
+    fields.Float: 'float',
+}
+
+
+def _attribute_getter(obj):
+    return lambda key: getattr(obj, key, None)
+
+
+class _SerializerCompiler:
+    """Generate straight-line serializer functions for Flask-RESTX models
+
+    The generated code mirrors ``flask_restx.marshal`` for the field types used
+    in this API and falls back to ``field.output`` for anything it does not
+    know how to inline, so output stays identical to ``marshal_with``.
+    """
+
+    def __init__(self):
+        self.namespace = {'_attribute_getter': _attribute_getter, '_EMPTY': {}, '_datetime': datetime}
+        self.sources = []
+        self.functions = {}
+        self._ids = itertools.count()
+
+    def constant(self, value):
+        name = f'_c{next(self._ids)}'
+        self.namespace[name] = value
+        return name
+
+    def function_for(self, model):
+        name = self.functions.get(id(model))
+        if name is None:
+            name = self.functions[id(model)] = f'_serialize_{next(self._ids)}'
+            self._emit_model(model, name)
+        return name
+
+    def _emit_model(self, model, name):
+        lines = [f'def {name}(obj):']
+        display = self._emit_object(model, 'obj', lines, (id(model),))
+        lines.append(f'    return {display}')
+        self.sources.append('\n'.join(lines))
+
+    def _emit_object(self, model, obj, lines, stack):
+        """Emit the lookups for ``model`` on ``obj`` and return its dict display
+
+        Directly nested models are flattened into the same function: their
+        lookups become further local statements and their output a nested
+        dict display, so no per-level function call is made.
+        """
+        getter = f'g{next(self._ids)}'
+        lines.extend([
+            f'    if {obj} is None:',
+            f'        {obj} = _EMPTY',
+            f'    {getter} = {obj}.get if isinstance({obj}, dict) else _attribute_getter({obj})',
+        ])
+        items = []
+        for key, field in model.items():
+            field = field() if isinstance(field, type) else field
+            value = f'v{next(self._ids)}'
+            if self._can_flatten(field, stack):
+                nested = field.nested
+                lines.append(f'    {value} = {getter}({self._source(field, key)!r})')
+                nested_obj = f'o{next(self._ids)}'
+                lines.append(f'    {nested_obj} = {value}')
+                expression = self._emit_object(nested, nested_obj, lines, stack + (id(nested),))
+                if field.allow_null:
+                    expression = f'None if {value} is None else {expression}'
+                elif field.default is not None:
+                    expression = f'{self.constant(field.default)} if {value} is None else {expression}'
+            else:
+                expression = self._inline(field, value, key, obj)
+                if expression is None:
+                    expression = f'{self.constant(field)}.output({key!r}, {obj})'
+                else:
+                    lines.append(f'    {value} = {getter}({self._source(field, key)!r})')
+            items.append(f'{key!r}: {expression}')
+        return '{' + ', '.join(items) + '}'
+
+    @staticmethod
+    def _source(field, key):
+        return key if field.attribute is None else field.attribute
+
+    def _can_flatten(self, field, stack):
+        return (
+            type(field) is fields.Nested
+            and not (field.skip_none or field.as_list or field.mask or callable(field.default))
+            and (field.attribute is None or (isinstance(field.attribute, str) and '.' not in field.attribute))
+            and id(field.nested) not in stack
+        )
+
+    def _inline(self, field, value, key=None, obj='obj'):
+        """Return an expression formatting ``value`` for ``field``, or None to fall back"""
+        if field.mask or callable(field.default):
+            return None
+        if field.attribute is not None and (not isinstance(field.attribute, str) or '.' in field.attribute):
+            return None
+
+        field_type = type(field)
+        if field_type in _INLINE_CASTS:
+            cast = _INLINE_CASTS[field_type]
+            default = field.format(field.default) if field.default else field.default
+            return f'{self.constant(default)} if {value} is None else {cast}({value})'
+
+        if field_type is fields.DateTime and field.dt_format == 'iso8601':
+            # datetimes are left for the orjson representation, which emits the
+            # same ISO 8601 text as ``isoformat()``; anything else is formatted here
+            default = field.format(field.default) if field.default else field.default
+            return (
+                f'{self.constant(default)} if {value} is None '
+                f'else {value} if {value}.__class__ is _datetime '
+                f'else {self.constant(field)}.format({value})'
+            )
+
+        if field_type is fields.Raw:
+            return f'{self.constant(field.default)} if {value} is None else {value}'
+
+        if field_type is fields.Nested:
+            if field.skip_none or field.as_list:
+                return None
+            call = f'{self.function_for(field.nested)}({value})'
+            if field.allow_null:
+                return f'None if {value} is None else {call}'
+            if field.default is not None:
+                return f'{self.constant(field.default)} if {value} is None else {call}'
+            return call
+
+        if field_type is fields.List and key is not None:
+            container = field.container
+            element = None if container.attribute is not None else self._inline(container, 'item')
+            if element is None:
+                return None
+            return (
+                f'[{element} for item in {value}] if isinstance({value}, (list, tuple)) '
+                f'else {self.constant(field.default)} if {value} is None '
+                f'else {self.constant(field)}.output({key!r}, {obj})'
+            )
+
+        if isinstance(field, fields.Raw) and field_type.output is fields.Raw.output:
+            # any other field that only customises ``format``
+            default = field.format(field.default) if field.default else field.default
+            return f'{self.constant(default)} if {value} is None else {self.constant(field)}.format({value})'
+        return None
+
+    def build(self, model):
+        name = self.function_for(getattr(model, 'resolved', model))
+        exec(compile('\n\n'.join(self.sources), f'<serializer {model.name}>', 'exec'), self.namespace)
+        return self.namespace[name]
+
+
+def compile_serializer(model):
+    """Compile a ``serialize(obj) -> dict`` function equivalent to ``marshal(obj, model)``"""
+    if any(isinstance(field, fields.Wildcard) for field in model.values()):
+        return lambda obj: marshal(obj, model)
+    return _SerializerCompiler().build(model)
+
+
+def fast_serializer(model):
+    """Return the compiled serializer for ``model``, compiling and caching it on first use"""
+    serialize = model.__dict__.get('fast_serialize')
+    if serialize is None:
+        serialize = model.fast_serialize = compile_serializer(model)
+    return serialize
+
+
+def attach_serializers(models):
+    """Compile ``fast_serialize`` for every model built by a model factory"""
+    for model in (models.values() if isinstance(models, dict) and not isinstance(models, RawModel) else [models]):
+        if isinstance(model, RawModel):
+            fast_serializer(model)
+    return models
+
+
+def marshal_fast(namespace, model, code=HTTPStatus.OK, description='Success', formats=None):
+    """Drop-in replacement for ``namespace.marshal_with`` using the compiled serializer
+
+    ``model`` may also be a key into ``namespace.models``; the model is then
+    documented by name and only built on the first request. ``formats`` maps
+    values of the ``format`` query parameter to alternative models. A handler
+    may return a ready ``Response`` to skip serialization.
+
+    A field mask sent in the ``RESTX_MASK_HEADER`` header (``X-Fields``) is
+    honoured as by ``marshal_with``: the data is marshalled by flask-restx
+    with the mask, and a ready JSON ``Response`` has the mask applied to its
+    decoded body.
+    """
+    models = {None: model, **(formats or {})}
+    serializers = {}
+
+    def model_for(fmt):
+        target = models[fmt]
+        return namespace.models[target] if isinstance(target, str) else target
+
+    def serializer_for(fmt):
+        serialize = serializers.get(fmt)
+        if serialize is None:
+            serialize = serializers[fmt] = fast_serializer(model_for(fmt))
+        return serialize
+
+    if isinstance(model, str):
+        name_of = getattr(namespace.models, 'name_of', None)
+        model = name_of(model) if name_of else namespace.models[model]
+    else:
+        serializer_for(None)
+
+    def serialize_data(data, mask):
+        fmt = request.args.get('format') if formats else None
+        fmt = fmt if fmt in models else None
+        if mask:
+            return marshal(data, model_for(fmt), mask=mask)
+        serialize = serializer_for(fmt)
+        try:
+            if isinstance(data, (list, tuple)):
+                return [serialize(item) for item in data]
+            return serialize(data)
+        except (TypeError, ValueError) as e:
+            raise MarshallingError(e) from e
+
+    def mask_response(resp, mask):
+        if resp.status_code != code or resp.mimetype != 'application/json':
+            return resp
+        resp.set_data(encode_json(Mask(mask).apply(orjson.loads(resp.get_data()))))
+        return resp
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            resp = func(*args, **kwargs)
+            mask = request.headers.get(current_app.config['RESTX_MASK_HEADER'])
+            if isinstance(resp, Response):
+                return mask_response(resp, mask) if mask else resp
+            if isinstance(resp, tuple):
+                data, *rest = resp
+                return (serialize_data(data, mask), *rest)
+            return serialize_data(resp, mask)
+
+        # Documents the mask header in Swagger, as marshal_with does
+        wrapper.__apidoc__ = merge(getattr(wrapper, '__apidoc__', {}), {'__mask__': True})
+        if formats:
+            wrapper = namespace.doc(params={'format': {
+                'description': 'Response layout',
+                'enum': list(formats),
+                'type': 'string'
+            }})(wrapper)
+        return namespace.response(int(code), description, model)(wrapper)
+
+    return decorator
@@ -0,0 +1,72 @@
+# api/representations.py
+
+import orjson
+from flask import Response, make_response, stream_with_context
+from flask.json.provider import JSONProvider
+
+# OPT_NON_STR_KEYS keeps the stdlib behaviour of stringifying int keys
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+
+def output_json(data, code, headers=None):
+    """Encode a response payload with orjson"""
+    resp = make_response(orjson.dumps(data, option=JSON_OPTIONS), code)
+    resp.headers['Content-Type'] = 'application/json'
+    resp.headers.extend(headers or {})
+    return resp
+
+
+def json_response(payload, status=200):
+    """Encode an already response-shaped payload straight to a JSON Response
+
+    Skips model serialization entirely, so only use it where the payload
+    has exactly the fields of the documented model. ``payload`` may also be
+    a body already encoded with ``encode_json``.
+    """
+    body = payload if isinstance(payload, bytes) else encode_json(payload)
+    return Response(body, status, mimetype='application/json')
+
+
+def encode_json(payload):
+    """Encode a payload to response body bytes, for callers that keep the bytes around"""
+    return orjson.dumps(payload, option=JSON_OPTIONS)
+
+
+def stream_json_array(items, status=200):
+    """Stream an iterable as a JSON array, encoding one element at a time
+
+    Like ``json_response`` the elements must already be response-shaped.
+    Streamed responses are not compressed or given an ETag.
+    """
+    def generate():
+        separator = b'['
+        for item in items:
+            yield separator
+            yield orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+            separator = b','
+        yield b']\n' if separator == b',' else b'[]\n'
+
+    return Response(stream_with_context(generate()), status, mimetype='application/json')
+
+
+def stream_ndjson(items, status=200, headers=None):
+    """Stream an iterable as newline-delimited JSON, one encoded element per line"""
+    def generate():
+        for item in items:
+            yield orjson.dumps(item, option=JSON_OPTIONS)
+
+    return Response(stream_with_context(generate()), status, headers, mimetype='application/x-ndjson')
+
+
+class OrjsonProvider(JSONProvider):
+    """``app.json`` provider backed by orjson, used by ``jsonify`` and ``request.get_json``"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=JSON_OPTIONS), mimetype='application/json')
@@ -1,46 +1,136 @@
 # api/routes/health.py
-from flask_restx import Resource, fields
+import os
+import threading
+import time
+from flask_restx import Resource
+from core.scheduler import MonitoringTask
 from services.pm2.service import PM2Service
+from api.models.serializers import marshal_fast
+from api.representations import encode_json, json_response
 import logging
-from typing import Dict
+from typing import Callable, Dict
+
+class HealthPoller:
+    """Runs a health check in the background and keeps its latest result
+
+    The thread is started by the first request each process serves, so a
+    worker forked from a preloaded app runs its own poller instead of
+    reading the parent's stale snapshot.
+    """
+    def __init__(self, check: Callable[[], Dict], interval: int, logger: logging.Logger):
+        self.check = check
+        self.interval = interval
+        self.logger = logger
+        self.snapshot = None  # (published at, encoded body or None, error message)
+        self.started_at = None
+        self._task = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start polling in the current process unless it already does"""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self.snapshot = None
+            self.started_at = time.monotonic()
+            self._task = MonitoringTask(
+                name='Health Poller',
+                interval=self.interval,
+                func=self._publish,
+                logger=self.logger
+            )
+            self._task.start()
+            self._pid = os.getpid()
+
+    def stop(self):
+        """Stop polling; the next request starts it again"""
+        with self._lock:
+            if self._task is not None:
+                self._task.stop()
+            self._task = None
+            self._pid = None
+
+    def _publish(self):
+        try:
+            self.snapshot = (time.monotonic(), encode_json(self.check()), None)
+        except Exception as e:
+            message = str(e)
+            self.logger.error(f"Health check failed: {message}", exc_info=True)
+            self.snapshot = (time.monotonic(), None, message)
 
 def create_health_routes(api, services: Dict):
-    """Create health check routes with improved error handling"""
-    
+    """Create health check routes with improved error handling
+
+    Returns the HealthPoller behind the route so its owner can stop it.
+    """
+
     # Get services
     pm2_service: PM2Service = services['pm2_service']
     logger: logging.Logger = services['logger']
-    
-    # Create health check response model
-    health_model = api.model('HealthCheck', {
-        'status': fields.String(description='API status', example='ok'),
-        'version': fields.String(description='API version', example='1.0'),
-        'pm2_status': fields.String(description='PM2 daemon status', example='online'),
-        'processes': fields.Integer(description='Number of running processes', example=3)
-    })
-    
+
+    # A background poller checks PM2 every HEALTH_POLL_INTERVAL seconds and
+    # publishes the encoded result; requests only read the latest snapshot.
+    # No snapshot, or one older than one interval plus HEALTH_PROBE_TIMEOUT,
+    # means the check is still starting or stuck, which is reported as 503.
+    poll_interval = services['config'].HEALTH_POLL_INTERVAL
+    probe_timeout = services['config'].HEALTH_PROBE_TIMEOUT
+    max_age = poll_interval + probe_timeout
+    cache_control = f'max-age={poll_interval}'
+
+    def check():
+        """Check PM2 daemon status"""
+        processes = pm2_service.list_processes()
+
+        statuses = [env.get('status') for p in processes if (env := p.get('pm2_env'))]
+        running_count = statuses.count('online')
+
+        return {
+            'status': 'ok',
+            'version': '1.0',
+            'pm2_status': 'online',
+            'processes': running_count
+        }
+
+    poller = HealthPoller(check, poll_interval, logger)
+
     @api.route('')
     class HealthCheck(Resource):
         @api.doc('health_check')
-        @api.marshal_with(health_model)
+        @marshal_fast(api, 'health')
         @api.response(200, 'Success')
         @api.response(500, 'Internal Server Error')
+        @api.response(503, 'PM2 status is not known yet or did not respond in time')
         def get(self):
             """Get system health status"""
-            try:
-                # Check PM2 daemon status
-                processes = pm2_service.list_processes()
-                
-                running_count = sum(1 for p in processes 
-                                  if p.get('pm2_env', {}).get('status') == 'online')
-                
-                return {
-                    'status': 'ok',
+            poller.ensure_started()
+            current = poller.snapshot
+            now = time.monotonic()
+            if current is None or now - current[0] > max_age:
+                # Before the first check has had its chance to finish the
+                # daemon's state is unknown rather than unresponsive
+                starting = current is None and now - poller.started_at <= max_age
+                if not starting:
+                    logger.warning(f"Health check has not completed within {probe_timeout} seconds")
+                response = json_response({
+                    'status': 'unhealthy',
                     'version': '1.0',
-                    'pm2_status': 'online',
-                    'processes': running_count
-                }
-                
-            except Exception as e:
-                logger.error(f"Health check failed: {str(e)}", exc_info=True)
-                api.abort(500, f"Health check failed: {str(e)}")
\ No newline at end of file
+                    'pm2_status': 'starting' if starting else 'unresponsive',
+                    'processes': None
+                }, 503)
+                response.headers['X-Cache'] = 'MISS'
+                response.headers['Retry-After'] = str(poll_interval)
+                return response
+
+            published_at, body, error = current
+            if body is None:
+                api.abort(500, f"Health check failed: {error}")
+
+            response = json_response(body)
+            response.headers['X-Cache'] = 'HIT'
+            response.headers['Cache-Control'] = cache_control
+            return response
+
+    return poller
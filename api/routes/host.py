@@ -1,11 +1,123 @@
 # api/routes/host.py
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 from flask import request
 from flask_restx import Resource
+from api.compression import revalidated
+from api.models.serializers import marshal_fast
+from api.representations import json_response
+from core.cache import now_iso
+from core.database import INTERVAL_START_SQL, DatabaseConnection
+
+# (component, metrics key, message label, warning above, critical above)
+ALERT_THRESHOLDS = (
+    ('cpu', 'cpu_percent', 'CPU usage', 75, 90),
+    ('memory', 'memory_percent', 'memory usage', 80, 90)
+)
+
+# (warning above, critical above) for every disk's percent_used
+DISK_ALERT_THRESHOLDS = (80, 90)
+
+ALERT_PREFIXES = {'critical': 'High', 'warning': 'Elevated'}
+
+# The three history queries are independent, so they run side by side;
+# each pool thread reads through its own connection. One pool serves every
+# app in the process and only starts threads once a query is submitted
+history_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='host-history')
+
+# Historical series per interval, followed by summary rows over the same
+# intervals that are marked by a NULL interval_start
+HOST_HISTORY_SQL = f'''
+    WITH intervals AS (
+        SELECT 
+            {INTERVAL_START_SQL} as interval_start,
+            COALESCE(AVG(cpu_percent), 0.0) as avg_cpu,
+            COALESCE(MAX(cpu_percent), 0.0) as max_cpu,
+            COALESCE(AVG(memory_percent), 0.0) as avg_memory,
+            COALESCE(MAX(memory_percent), 0.0) as max_memory,
+            COALESCE(AVG(swap_percent), 0.0) as avg_swap,
+            COALESCE(MAX(load_avg_1m), 0.0) as max_load_1m,
+            COALESCE(MAX(load_avg_5m), 0.0) as max_load_5m,
+            COALESCE(MAX(load_avg_15m), 0.0) as max_load_15m
+        FROM host_metrics 
+        WHERE timestamp BETWEEN ? AND ?
+        GROUP BY interval_start
+        ORDER BY interval_start ASC
+    )
+    SELECT * FROM intervals
+    UNION ALL
+    SELECT 
+        NULL,
+        ROUND(AVG(avg_cpu), 2),
+        ROUND(MAX(max_cpu), 2),
+        ROUND(AVG(avg_memory), 2),
+        ROUND(MAX(max_memory), 2),
+        ROUND(MAX(avg_swap), 2),
+        ROUND(MAX(max_load_1m), 2),
+        ROUND(MAX(max_load_5m), 2),
+        ROUND(MAX(max_load_15m), 2)
+    FROM intervals
+'''
+
+DISK_HISTORY_SQL = f'''
+    WITH intervals AS (
+        SELECT 
+            {INTERVAL_START_SQL} as interval_start,
+            device,
+            COALESCE(AVG(percent_used), 0.0) as avg_usage,
+            COALESCE(MAX(percent_used), 0.0) as max_usage,
+            COALESCE(AVG(free), 0.0) as avg_free
+        FROM disk_metrics 
+        WHERE timestamp BETWEEN ? AND ?
+        GROUP BY interval_start, device
+        ORDER BY device, interval_start ASC
+    )
+    SELECT * FROM intervals
+    UNION ALL
+    SELECT 
+        NULL,
+        device,
+        ROUND(AVG(avg_usage), 2),
+        ROUND(MAX(max_usage), 2),
+        ROUND(MIN(avg_free), 2)
+    FROM intervals
+    GROUP BY device
+'''
+
+NETWORK_HISTORY_SQL = f'''
+    WITH intervals AS (
+        SELECT 
+            {INTERVAL_START_SQL} as interval_start,
+            interface,
+            COALESCE(SUM(bytes_sent), 0.0) as total_sent,
+            COALESCE(SUM(bytes_recv), 0.0) as total_recv,
+            COALESCE(SUM(errors_in + errors_out), 0) as total_errors
+        FROM network_metrics 
+        WHERE timestamp BETWEEN ? AND ?
+        GROUP BY interval_start, interface
+        ORDER BY interface, interval_start ASC
+    )
+    SELECT * FROM intervals
+    UNION ALL
+    SELECT 
+        NULL,
+        interface,
+        ROUND(SUM(total_sent) / 1073741824.0, 2),
+        ROUND(SUM(total_recv) / 1073741824.0, 2),
+        SUM(total_errors)
+    FROM intervals
+    GROUP BY interface
+'''
 
 def create_host_routes(namespace, services):
     """Create routes for host system monitoring"""
+
+    # One read-only connection per worker thread, kept open across requests
+    # so SQLite's page cache and prepared statement cache stay warm
+    history_db = DatabaseConnection(services['config'].DB_PATH, read_only=True)
     
     @namespace.route('/metrics')
     class HostMetrics(Resource):
@@ -20,186 +132,185 @@ def create_host_routes(namespace, services):
                 500: 'Internal server error'
             }
         )
-        @namespace.marshal_with(namespace.models['host_metrics'])
+        @marshal_fast(namespace, 'host_metrics')
         def get(self):
             """Get current host system metrics"""
             try:
-                return self.host_monitor.get_all_metrics()
+                # get_all_metrics() already has exactly the HostMetrics fields
+                return json_response(self.host_monitor.get_all_metrics())
             except Exception as e:
-                self.logger.error(f"Error getting host metrics: {str(e)}")
-                namespace.abort(500, f"Internal server error: {str(e)}")
-
-# api/routes/host.py (continued)
+                message = str(e)
+                self.logger.error(f"Error getting host metrics: {message}")
+                namespace.abort(500, f"Internal server error: {message}")
 
     @namespace.route('/historical')
     class HostHistorical(Resource):
-        def _get_historical_metrics(self, start_time, end_time, interval):
-            """Get historical host metrics with aggregation"""
-            conn = sqlite3.connect(self.config.DB_PATH)
+        db = history_db
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.config = services['config']
+            self.logger = services['logger']
+
+        @namespace.doc(
+            params={
+                'period': {'description': 'Time period in hours', 'type': 'integer', 'default': 24},
+                'interval': {'description': 'Aggregation interval in minutes', 'type': 'integer', 'default': 5}
+            },
+            responses={
+                200: 'Success',
+                400: 'Invalid parameters',
+                500: 'Internal server error'
+            }
+        )
+        @revalidated
+        @marshal_fast(namespace, 'historical_metrics')
+        def get(self):
+            """Get aggregated historical host metrics"""
             try:
-                cursor = conn.cursor()
-                
-                # Get host metrics
-                cursor.execute('''
-                    WITH intervals AS (
-                        SELECT 
-                            strftime('%Y-%m-%d %H:%M:00', timestamp) as interval_start,
-                            AVG(cpu_percent) as avg_cpu,
-                            MAX(cpu_percent) as max_cpu,
-                            AVG(memory_percent) as avg_memory,
-                            MAX(memory_percent) as max_memory,
-                            AVG(swap_percent) as avg_swap,
-                            MAX(load_avg_1m) as max_load_1m,
-                            MAX(load_avg_5m) as max_load_5m,
-                            MAX(load_avg_15m) as max_load_15m
-                        FROM host_metrics 
-                        WHERE timestamp BETWEEN ? AND ?
-                        GROUP BY interval_start
-                        ORDER BY interval_start ASC
-                    )
-                    SELECT * FROM intervals
-                ''', (
-                    start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                    end_time.strftime('%Y-%m-%d %H:%M:%S')
-                ))
-                
-                host_rows = cursor.fetchall()
-                
-                # Get disk metrics
-                cursor.execute('''
-                    WITH intervals AS (
-                        SELECT 
-                            strftime('%Y-%m-%d %H:%M:00', timestamp) as interval_start,
-                            device,
-                            AVG(percent_used) as avg_usage,
-                            MAX(percent_used) as max_usage,
-                            AVG(free) as avg_free
-                        FROM disk_metrics 
-                        WHERE timestamp BETWEEN ? AND ?
-                        GROUP BY interval_start, device
-                        ORDER BY interval_start ASC
-                    )
-                    SELECT * FROM intervals
-                ''', (
-                    start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                    end_time.strftime('%Y-%m-%d %H:%M:%S')
-                ))
-                
-                disk_rows = cursor.fetchall()
-                
-                # Get network metrics
-                cursor.execute('''
-                    WITH intervals AS (
-                        SELECT 
-                            strftime('%Y-%m-%d %H:%M:00', timestamp) as interval_start,
-                            interface,
-                            SUM(bytes_sent) as total_sent,
-                            SUM(bytes_recv) as total_recv,
-                            SUM(errors_in + errors_out) as total_errors
-                        FROM network_metrics 
-                        WHERE timestamp BETWEEN ? AND ?
-                        GROUP BY interval_start, interface
-                        ORDER BY interval_start ASC
-                    )
-                    SELECT * FROM intervals
-                ''', (
-                    start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                    end_time.strftime('%Y-%m-%d %H:%M:%S')
-                ))
-                
-                network_rows = cursor.fetchall()
-                
+                period = int(request.args.get('period', 24))
+                interval = int(request.args.get('interval', 5))
+                if interval < 1:
+                    raise ValueError("Interval must be at least 1 minute")
+
+                end_time = datetime.now()
+                start_time = end_time - timedelta(hours=period)
+                metrics, summary = self._get_historical_metrics(start_time, end_time, interval)
+
                 return {
-                    'timestamps': [row[0] for row in host_rows],
-                    'cpu': {
-                        'average': [float(row[1]) if row[1] is not None else 0.0 for row in host_rows],
-                        'max': [float(row[2]) if row[2] is not None else 0.0 for row in host_rows],
-                        'load_averages': {
-                            '1m': [float(row[6]) if row[6] is not None else 0.0 for row in host_rows],
-                            '5m': [float(row[7]) if row[7] is not None else 0.0 for row in host_rows],
-                            '15m': [float(row[8]) if row[8] is not None else 0.0 for row in host_rows]
-                        }
-                    },
-                    'memory': {
-                        'average': [float(row[3]) if row[3] is not None else 0.0 for row in host_rows],
-                        'max': [float(row[4]) if row[4] is not None else 0.0 for row in host_rows],
-                        'swap': [float(row[5]) if row[5] is not None else 0.0 for row in host_rows]
-                    },
-                    'disks': self._format_disk_metrics(disk_rows),
-                    'network': self._format_network_metrics(network_rows)
+                    'start_time': start_time,
+                    'end_time': end_time,
+                    'interval': f'{interval} minutes',
+                    'metrics': metrics,
+                    'summary': summary
                 }
-                
-            finally:
-                conn.close()
+
+            except ValueError as e:
+                namespace.abort(400, str(e))
+            except Exception as e:
+                message = str(e)
+                self.logger.error(f"Error getting historical host metrics: {message}")
+                namespace.abort(500, f"Internal server error: {message}")
+
+        def _get_historical_metrics(self, start_time, end_time, interval):
+            """Get historical host metrics with aggregation
+
+            Each query returns the per-interval series followed by its summary
+            rows, which SQLite aggregates over the same intervals and marks
+            with a NULL interval_start.
+
+            Returns:
+                Tuple of (metrics, summary)
+            """
+            params = (
+                interval * 60,
+                start_time.strftime('%Y-%m-%d %H:%M:%S'),
+                end_time.strftime('%Y-%m-%d %H:%M:%S')
+            )
+            host_query, disk_query, network_query = (
+                history_pool.submit(self._fetch_all, sql, params)
+                for sql in (HOST_HISTORY_SQL, DISK_HISTORY_SQL, NETWORK_HISTORY_SQL)
+            )
+
+            *host_rows, host_summary = host_query.result()
+            disk_rows = disk_query.result()
+            network_rows = network_query.result()
+            
+            metrics = {
+                'timestamps': [row[0] for row in host_rows],
+                'cpu': {
+                    'average': [row[1] for row in host_rows],
+                    'max': [row[2] for row in host_rows],
+                    'load_averages': {
+                        '1m': [row[6] for row in host_rows],
+                        '5m': [row[7] for row in host_rows],
+                        '15m': [row[8] for row in host_rows]
+                    }
+                },
+                'memory': {
+                    'average': [row[3] for row in host_rows],
+                    'max': [row[4] for row in host_rows],
+                    'swap': [row[5] for row in host_rows]
+                },
+                'disks': self._format_disk_metrics(disk_rows),
+                'network': self._format_network_metrics(network_rows)
+            }
+            summary = self._calculate_summary(host_rows, host_summary, disk_rows, network_rows)
+            return metrics, summary
+
+        def _fetch_all(self, sql, params):
+            """Run a query on the calling thread's connection"""
+            return self.db.get_connection().execute(sql, params).fetchall()
 
         def _format_disk_metrics(self, rows):
             """Format disk metrics by device"""
-            devices = {}
-            for row in rows:
-                device = row[1]
-                if device not in devices:
-                    devices[device] = {
-                        'usage_avg': [],
-                        'usage_max': [],
-                        'free_avg': []
-                    }
-                devices[device]['usage_avg'].append(float(row[2]) if row[2] is not None else 0.0)
-                devices[device]['usage_max'].append(float(row[3]) if row[3] is not None else 0.0)
-                devices[device]['free_avg'].append(float(row[4]) if row[4] is not None else 0.0)
-            return devices
+            return {
+                device: {
+                    'usage_avg': [row[2] for row in series],
+                    'usage_max': [row[3] for row in series],
+                    'free_avg': [row[4] for row in series]
+                }
+                for device, series in self._group_series(rows)
+            }
 
         def _format_network_metrics(self, rows):
             """Format network metrics by interface"""
-            interfaces = {}
-            for row in rows:
-                interface = row[1]
-                if interface not in interfaces:
-                    interfaces[interface] = {
-                        'bytes_sent': [],
-                        'bytes_recv': [],
-                        'errors': []
-                    }
-                interfaces[interface]['bytes_sent'].append(float(row[2]) if row[2] is not None else 0.0)
-                interfaces[interface]['bytes_recv'].append(float(row[3]) if row[3] is not None else 0.0)
-                interfaces[interface]['errors'].append(int(row[4]) if row[4] is not None else 0)
-            return interfaces
-
-        def _calculate_summary(self, metrics):
-            """Calculate summary statistics for historical metrics"""
-            if not metrics['timestamps']:
+            return {
+                interface: {
+                    'bytes_sent': [row[2] for row in series],
+                    'bytes_recv': [row[3] for row in series],
+                    'errors': [row[4] for row in series]
+                }
+                for interface, series in self._group_series(rows)
+            }
+
+        def _group_series(self, rows):
+            """Group interval rows, already ordered by their key column, by that key"""
+            series_rows = [row for row in rows if row[0] is not None]
+            return ((key, list(group)) for key, group in groupby(series_rows, key=itemgetter(1)))
+
+        def _calculate_summary(self, host_rows, host_summary, disk_rows, network_rows):
+            """Unpack the summary rows SQLite computed for historical metrics"""
+            if not host_rows:
                 return {'error': 'No data available'}
 
+            _, cpu_avg, cpu_max, memory_avg, memory_max, swap_max, load_1m, load_5m, load_15m = host_summary
             return {
                 'cpu': {
-                    'average': round(sum(metrics['cpu']['average']) / len(metrics['cpu']['average']), 2),
-                    'max': round(max(metrics['cpu']['max']), 2),
+                    'average': cpu_avg,
+                    'max': cpu_max,
                     'peak_load': {
-                        '1m': round(max(metrics['cpu']['load_averages']['1m']), 2),
-                        '5m': round(max(metrics['cpu']['load_averages']['5m']), 2),
-                        '15m': round(max(metrics['cpu']['load_averages']['15m']), 2)
+                        '1m': load_1m,
+                        '5m': load_5m,
+                        '15m': load_15m
                     }
                 },
                 'memory': {
-                    'average_usage': round(sum(metrics['memory']['average']) / len(metrics['memory']['average']), 2),
-                    'peak_usage': round(max(metrics['memory']['max']), 2),
-                    'peak_swap': round(max(metrics['memory']['swap']), 2)
+                    'average_usage': memory_avg,
+                    'peak_usage': memory_max,
+                    'peak_swap': swap_max
                 },
                 'disks': {
                     device: {
-                        'avg_usage': round(sum(data['usage_avg']) / len(data['usage_avg']), 2),
-                        'peak_usage': round(max(data['usage_max']), 2),
-                        'min_free': round(min(data['free_avg']), 2)
-                    } for device, data in metrics['disks'].items()
+                        'avg_usage': avg_usage,
+                        'peak_usage': peak_usage,
+                        'min_free': min_free
+                    } for start, device, avg_usage, peak_usage, min_free in disk_rows if start is None
                 },
                 'network': {
                     interface: {
-                        'total_sent_gb': round(sum(data['bytes_sent']) / (1024 * 1024 * 1024), 2),
-                        'total_recv_gb': round(sum(data['bytes_recv']) / (1024 * 1024 * 1024), 2),
-                        'total_errors': sum(data['errors'])
-                    } for interface, data in metrics['network'].items()
+                        'total_sent_gb': sent_gb,
+                        'total_recv_gb': recv_gb,
+                        'total_errors': errors
+                    } for start, interface, sent_gb, recv_gb, errors in network_rows if start is None
                 }
             }
 
+    # (collector sample seq, CPU and memory alerts) from the last evaluation;
+    # those only change when the collector takes a new sample, while disk
+    # usage is read and checked on every request
+    last_alerts = [(None, None)]
+
     @namespace.route('/alerts')
     class HostAlerts(Resource):
         """Endpoint for host system alerts and thresholds"""
@@ -218,61 +329,59 @@ def create_host_routes(namespace, services):
         def get(self):
             """Get current system alerts based on thresholds"""
             try:
-                metrics = self.host_monitor.get_all_metrics()
-                alerts = []
+                seq = self.host_monitor.get_sample_seq()
+                cached_seq, usage_alerts = last_alerts[0]
+                if seq != cached_seq:
+                    metrics = self.host_monitor.get_all_metrics()
+                    usage_alerts = self._evaluate_usage_alerts(metrics)
+                    last_alerts[0] = (seq, usage_alerts)
+                    disks = metrics['disk_usage']
+                else:
+                    disks = self.host_monitor.get_disk_info()
+                alerts = usage_alerts + self._evaluate_disk_alerts(disks)
 
-                # Check CPU usage
-                if metrics['cpu']['percent'] > 90:
-                    alerts.append({
-                        'level': 'critical',
-                        'component': 'cpu',
-                        'message': f"High CPU usage: {metrics['cpu']['percent']}%"
-                    })
-                elif metrics['cpu']['percent'] > 75:
-                    alerts.append({
-                        'level': 'warning',
-                        'component': 'cpu',
-                        'message': f"Elevated CPU usage: {metrics['cpu']['percent']}%"
-                    })
+                return {
+                    'timestamp': now_iso(),
+                    'alert_count': len(alerts),
+                    'alerts': alerts
+                }
+
+            except Exception as e:
+                message = str(e)
+                self.logger.error(f"Error getting system alerts: {message}")
+                namespace.abort(500, f"Internal server error: {message}")
 
-                # Check memory usage
-                if metrics['memory']['percent_used'] > 90:
+        def _evaluate_usage_alerts(self, metrics):
+            """Check CPU and memory usage against the alert thresholds"""
+            alerts = []
+            for component, key, label, warning, critical in ALERT_THRESHOLDS:
+                value = metrics[key]
+                level = 'critical' if value > critical else 'warning' if value > warning else None
+                if level:
                     alerts.append({
-                        'level': 'critical',
-                        'component': 'memory',
-                        'message': f"High memory usage: {metrics['memory']['percent_used']}%"
+                        'level': level,
+                        'component': component,
+                        'message': f"{ALERT_PREFIXES[level]} {label}: {value}%"
                     })
-                elif metrics['memory']['percent_used'] > 80:
+
+            return alerts
+
+        def _evaluate_disk_alerts(self, disks):
+            """Check every disk's usage against the disk alert thresholds"""
+            alerts = []
+            warning, critical = DISK_ALERT_THRESHOLDS
+            for disk in disks:
+                value = disk['percent_used']
+                level = 'critical' if value > critical else 'warning' if value > warning else None
+                if level:
                     alerts.append({
-                        'level': 'warning',
-                        'component': 'memory',
-                        'message': f"Elevated memory usage: {metrics['memory']['percent_used']}%"
+                        'level': level,
+                        'component': 'disk',
+                        'message': f"{ALERT_PREFIXES[level]} disk usage on {disk['mount_point']}: {value}%"
                     })
 
-                # Check disk usage
-                for disk in metrics['disks']:
-                    if disk['percent_used'] > 90:
-                        alerts.append({
-                            'level': 'critical',
-                            'component': 'disk',
-                            'message': f"High disk usage on {disk['mount_point']}: {disk['percent_used']}%"
-                        })
-                    elif disk['percent_used'] > 80:
-                        alerts.append({
-                            'level': 'warning',
-                            'component': 'disk',
-                            'message': f"Elevated disk usage on {disk['mount_point']}: {disk['percent_used']}%"
-                        })
-
-                return {
-                    'timestamp': datetime.now().isoformat(),
-                    'alert_count': len(alerts),
-                    'alerts': alerts
-                }
+            return alerts
 
-            except Exception as e:
-                self.logger.error(f"Error getting system alerts: {str(e)}")
-                namespace.abort(500, f"Internal server error: {str(e)}")
     @namespace.route('/details')
     class HostDetails(Resource):
         def __init__(self, *args, **kwargs):
@@ -286,13 +395,14 @@ def create_host_routes(namespace, services):
                 500: 'Internal server error'
             }
         )
-        @namespace.marshal_with(namespace.models['host_info'])
+        @marshal_fast(namespace, 'host_info')
         def get(self):
             """Get detailed host system information"""
             try:
                 return self.host_monitor.get_host_details()
             except Exception as e:
-                self.logger.error(f"Error getting host details: {str(e)}")
-                namespace.abort(500, f"Internal server error: {str(e)}")
+                message = str(e)
+                self.logger.error(f"Error getting host details: {message}")
+                namespace.abort(500, f"Internal server error: {message}")
 
-    return None              
+    return None
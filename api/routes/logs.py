@@ -1,40 +1,90 @@
 # /api/routes/logs.py
 
-from datetime import datetime
-from flask import request
-from flask_restx import Resource, fields
+import os
+from functools import lru_cache
+from flask import Response, request
+from flask_restx import Resource
 from core.exceptions import ProcessNotFoundError
-from typing import Dict, Optional
+from api.models.logs import LOG_TYPES, MAX_LOG_LINES
+from api.models.serializers import marshal_fast
+from api.representations import encode_json, json_response, stream_ndjson
+from core.cache import TTLCache, now_iso
+from typing import Dict, Optional, Tuple
+
+# Log file paths per process name; they only change when a process is recreated
+_log_paths_cache = TTLCache()
+
+# (ETag, encoded log response) per (process name, log type, lines), for
+# dashboards polling the same query. Bodies run up to MAX_LOG_LINES lines, so only the
+# most recently used queries are kept
+LOG_RESPONSE_CACHE_SIZE = 256
+_log_response_cache = TTLCache(maxsize=LOG_RESPONSE_CACHE_SIZE)
+
+@lru_cache(maxsize=128)
+def _parse_log_parameters(arg_items: Tuple) -> Tuple[str, int]:
+    """Parse and validate log request parameters
+
+    Takes the sorted query argument items so repeated polls with the same
+    query reuse the parsed result.
+
+    Returns:
+        Tuple of (log_type, num_lines)
+    """
+    args = dict(arg_items)
+    try:
+        # Handle both flat and structured parameters
+        if 'lines[logType]' in args:
+            # Structured parameters
+            log_type = args.get('lines[logType]', 'out')
+            lines = args.get('lines[lines]')
+        else:
+            # Flat parameters
+            log_type = args.get('logType', 'out')
+            lines = args.get('lines')
+        
+        # Validate log type
+        if log_type not in LOG_TYPES:
+            raise ValueError(f"Invalid log type: {log_type}")
+        
+        # Validate number of lines; anything but a short run of digits is
+        # rejected before int() sees it
+        if lines is None:
+            num_lines = 100
+        elif lines.isdecimal() and len(lines) <= len(str(MAX_LOG_LINES)):
+            num_lines = int(lines)
+        else:
+            num_lines = 0
+        if not 1 <= num_lines <= MAX_LOG_LINES:
+            raise ValueError(f"Number of lines must be between 1 and {MAX_LOG_LINES}")
+        
+        return log_type, num_lines
+        
+    except ValueError as e:
+        raise ValueError(f"Invalid parameters: {str(e)}")
 
 def create_log_routes(namespace, services=None):
     """Create enhanced log management routes"""
     
-    # Create models for request parameters
-    log_params = namespace.model('LogParameters', {
-        'logType': fields.String(description='Log type (error/out)', enum=['error', 'out'], default='out'),
-        'lines': fields.Integer(description='Number of lines to return', default=100, min=1, max=10000)
-    })
-
-    # Create model for log response
-    log_response = namespace.model('LogResponse', {
-        'logs': fields.List(fields.String, description='Log entries'),
-        'files': fields.Raw(description='Log file information'),
-        'metadata': fields.Raw(description='Log metadata')
-    })
-    
-    @namespace.route('/<string:process_name>')
+    @namespace.route('/<pname:process_name>')
     class ProcessLogs(Resource):
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
             self.log_manager = services['log_manager']
             self.logger = services['logger']
             self.pm2_service = services['pm2_service']
+            self.config = services['config']
 
         @namespace.doc(
             params={
-                'logType': {'description': 'Log type (error/out)', 'enum': ['error', 'out'], 'default': 'out'},
-                'lines': {'description': 'Number of lines to return', 'type': 'integer', 'default': 100}
+                'logType': {'description': 'Log type (error/out)', 'enum': LOG_TYPES, 'default': 'out'},
+                'lines': {'description': 'Number of lines to return', 'type': 'integer', 'default': 100},
+                'format': {
+                    'description': 'ndjson streams one log line per row, with files and metadata in the X-Log-Metadata header',
+                    'enum': ['ndjson'],
+                    'type': 'string'
+                }
             },
+            body=namespace.models['log_params'],
             responses={
                 200: 'Success',
                 404: 'Process not found',
@@ -42,81 +92,97 @@ def create_log_routes(namespace, services=None):
                 500: 'Internal server error'
             }
         )
-        @namespace.expect(log_params)
-        @namespace.marshal_with(log_response)
+        @marshal_fast(namespace, 'log_response')
         def get(self, process_name: str):
             """Get process logs with type filtering"""
             try:
                 # Parse and validate parameters
-                params = self._parse_log_parameters(request.args)
-                
-                # Verify process exists
-                process = self.pm2_service.get_process(process_name)
-                
-                # Get log paths from PM2 environment
-                log_paths = self._get_log_paths(process['pm2_env'])
-                
-                # Get logs based on type
-                log_type = params['logType']
-                num_lines = params['lines']
-                
-                logs_data = self.log_manager.get_process_logs_by_type(
-                    process_name=process_name,
-                    log_type=log_type,
-                    num_lines=num_lines,
-                    log_paths=log_paths
-                )
-                
-                # Add metadata
-                logs_data['metadata'] = {
-                    'timestamp': datetime.now().isoformat(),
-                    'process_name': process_name,
-                    'log_type': log_type,
-                    'lines_requested': num_lines,
-                    'lines_returned': len(logs_data['logs'])
-                }
+                log_type, num_lines = _parse_log_parameters(tuple(sorted(request.args.items())))
                 
-                return logs_data
+                if request.args.get('format') == 'ndjson':
+                    logs_data = self._get_logs(process_name, log_type, num_lines)
+                    # Header values go out as latin-1, so decoding the UTF-8 body
+                    # that way sends its exact bytes; the trailing newline would
+                    # be rejected as a header break
+                    envelope = encode_json({'files': logs_data['files'], 'metadata': logs_data['metadata']}).rstrip().decode('latin-1')
+                    return stream_ndjson(logs_data['logs'], headers={'X-Log-Metadata': envelope})
+
+                # The log file's size and mtime identify its content, so a
+                # client that already has it gets a 304 without a read
+                etag = self._log_etag(process_name, log_type, num_lines)
+                if etag and request.if_none_match.contains_weak(etag):
+                    response = Response(status=304)
+                    response.set_etag(etag, weak=True)
+                    return response
+
+                # logs_data has exactly the LogResponse fields, so its encoded
+                # body is cached and served as is to pollers of the same query;
+                # a body cached for an older ETag is replaced, so it never
+                # outlives its file and a growing log keeps one entry
+                key = (process_name, log_type, num_lines)
+                build = lambda: (etag, encode_json(self._get_logs(process_name, log_type, num_lines)))
+                cached_etag, body = _log_response_cache.get_or_set(key, build, self.config.LOG_RESPONSE_CACHE_TTL)
+                if cached_etag != etag:
+                    entry = build()
+                    _log_response_cache.set(key, entry, self.config.LOG_RESPONSE_CACHE_TTL)
+                    body = entry[1]
+                response = json_response(body)
+                if etag:
+                    response.set_etag(etag, weak=True)
+                return response
                 
             except ProcessNotFoundError as e:
                 namespace.abort(404, str(e))
             except ValueError as e:
                 namespace.abort(400, str(e))
             except Exception as e:
-                self.logger.error(f"Error getting logs for {process_name}: {str(e)}")
-                namespace.abort(500, f"Internal server error: {str(e)}")
+                message = str(e)
+                self.logger.error("Error getting logs for %s: %s", process_name, message)
+                namespace.abort(500, f"Internal server error: {message}")
 
-        def _parse_log_parameters(self, args) -> Dict:
-            """Parse and validate log request parameters"""
+        def _log_etag(self, process_name: str, log_type: str, num_lines: int) -> Optional[str]:
+            """ETag for a log response from the log file's size and mtime, if it exists"""
+            path = self._get_cached_log_paths(process_name).get(log_type)
             try:
-                # Handle both flat and structured parameters
-                if 'lines[logType]' in args:
-                    # Structured parameters
-                    log_type = args.get('lines[logType]', 'out')
-                    num_lines = int(args.get('lines[lines]', 100))
-                else:
-                    # Flat parameters
-                    log_type = args.get('logType', 'out')
-                    num_lines = int(args.get('lines', 100))
-                
-                # Validate log type
-                if log_type not in ['error', 'out']:
-                    raise ValueError(f"Invalid log type: {log_type}")
-                
-                # Validate number of lines
-                if not 1 <= num_lines <= 10000:
-                    raise ValueError("Number of lines must be between 1 and 10000")
-                
-                return {
-                    'logType': log_type,
-                    'lines': num_lines
-                }
-                
-            except ValueError as e:
-                raise ValueError(f"Invalid parameters: {str(e)}")
+                stat = os.stat(path)
+            except (TypeError, OSError):
+                return None
+            return f"{stat.st_size:x}-{stat.st_mtime_ns:x}-{log_type}-{num_lines}"
+
+        def _get_cached_log_paths(self, process_name: str) -> Dict:
+            """Get a process's log paths, verifying it exists when they are not cached"""
+            return _log_paths_cache.get_or_set(
+                process_name,
+                lambda: self._get_log_paths(process_name),
+                self.config.LOG_PATHS_CACHE_TTL
+            )
+
+        def _get_logs(self, process_name: str, log_type: str, num_lines: int) -> Dict:
+            """Read a process's logs and add the response metadata"""
+            # Verify process exists and get its log paths
+            log_paths = self._get_cached_log_paths(process_name)
+            
+            # Get logs based on type
+            logs_data = self.log_manager.get_process_logs_by_type(
+                process_name=process_name,
+                log_type=log_type,
+                num_lines=num_lines,
+                log_paths=log_paths
+            )
+            
+            # Add metadata
+            logs_data['metadata'] = {
+                'timestamp': now_iso(),
+                'process_name': process_name,
+                'log_type': log_type,
+                'lines_requested': num_lines,
+                'lines_returned': len(logs_data['logs'])
+            }
+            return logs_data
 
-        def _get_log_paths(self, pm2_env: Dict) -> Dict:
-            """Extract log paths from PM2 environment"""
+        def _get_log_paths(self, process_name: str) -> Dict:
+            """Look up a process's log paths in PM2"""
+            pm2_env = self.pm2_service.get_process(process_name)['pm2_env']
             return {
                 'out': pm2_env.get('pm_out_log_path'),
                 'error': pm2_env.get('pm_err_log_path')
@@ -132,6 +198,8 @@ def create_log_routes(namespace, services=None):
         def delete(self, process_name: str):
             """Clear process logs"""
             try:
+                _log_paths_cache.invalidate(process_name)
+                _log_response_cache.invalidate()
                 result = self.log_manager.clear_process_logs(process_name)
                 return {
                     'message': f"Logs cleared for process {process_name}",
@@ -141,7 +209,8 @@ def create_log_routes(namespace, services=None):
             except ProcessNotFoundError as e:
                 namespace.abort(404, str(e))
             except Exception as e:
-                self.logger.error(f"Error clearing logs for {process_name}: {str(e)}")
-                namespace.abort(500, f"Internal server error: {str(e)}")
+                message = str(e)
+                self.logger.error("Error clearing logs for %s: %s", process_name, message)
+                namespace.abort(500, f"Internal server error: {message}")
 
     return None
\ No newline at end of file
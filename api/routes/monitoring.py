@@ -1,21 +1,217 @@
 # api/routes/monitoring.py
 
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+import time
 from flask import request
 from flask_restx import Resource
 from core.exceptions import ProcessNotFoundError
-import sqlite3
-from typing import Dict, List
+from api.compression import revalidated
+from api.models.serializers import marshal_fast
+from api.representations import encode_json, json_response
+from core.cache import TTLCache
+from core.database import INTERVAL_START_SQL, DatabaseConnection
+
+HEATMAP_METRICS = ('cpu', 'memory')
+
+# Status requests read recent errors on a pool thread, which uses its own
+# connection, while the request thread waits on PM2. One pool serves every
+# app in the process and only starts threads once a read is submitted
+status_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='process-status')
+
+# Most encoded heatmap and historical bodies kept per app; keys come from
+# request parameters, so only the most recently used are kept
+MONITORING_RESPONSE_CACHE_SIZE = 256
+
+# Color bands per heatmap metric, shaped exactly like the HeatmapThresholds model
+HEATMAP_THRESHOLDS = {
+    'cpu': {
+        'low': {'max': 30.0, 'color': 'green'},
+        'medium': {'max': 70.0, 'color': 'yellow'},
+        'high': {'max': 90.0, 'color': 'orange'},
+        'critical': {'max': None, 'color': 'red'}
+    },
+    'memory': {
+        'low': {'max': 256.0, 'color': 'green'},  # MB
+        'medium': {'max': 512.0, 'color': 'yellow'},
+        'high': {'max': 1024.0, 'color': 'orange'},
+        'critical': {'max': None, 'color': 'red'}
+    }
+}
+
+# Per-interval CPU, memory, status and error/warning counts for the
+# intervals that have samples
+PROCESS_METRICS_SQL = f'''
+    SELECT 
+        {INTERVAL_START_SQL} as interval_start,
+        AVG(cpu_usage) as cpu,
+        AVG(memory_usage) as memory,
+        MAX(status) as status,
+        MAX(has_error) as has_error,
+        COUNT(CASE WHEN has_error = 1 THEN 1 END) as error_count,
+        COUNT(CASE WHEN has_warning = 1 THEN 1 END) as warning_count
+    FROM service_status
+    WHERE service_name = ?
+    AND timestamp BETWEEN ? AND ?
+    GROUP BY interval_start
+'''
+
+RECENT_ERRORS_SQL = '''
+    SELECT timestamp, status, has_error, has_warning
+    FROM service_status 
+    WHERE service_name = ? 
+    AND timestamp >= ?
+    AND (has_error = 1 OR has_warning = 1)
+    ORDER BY timestamp DESC
+'''
+
+# Per-interval average of each heatmap metric's column, with the interval's
+# error and warning flags
+HEATMAP_SQL = {
+    metric: f'''
+        WITH intervals AS (
+            SELECT 
+                {INTERVAL_START_SQL} as interval_start,
+                COALESCE(AVG({column}), 0.0) as avg_value,
+                MAX(has_error) as had_error,
+                MAX(has_warning) as had_warning
+            FROM service_status 
+            WHERE service_name = ? 
+            AND timestamp BETWEEN ? AND ?
+            GROUP BY interval_start
+            ORDER BY interval_start ASC
+        )
+        SELECT * FROM intervals
+    '''
+    for metric, column in (('cpu', 'cpu_usage'), ('memory', 'memory_usage'))
+}
+
+# The complete HistoricalMetrics response body, built by SQLite from the
+# per-interval process history: the series as arrays and the statistics
+# over those same intervals. The bound values are the interval length in
+# seconds, the process name and range bounds for the query, then the process
+# name, ISO range bounds and interval label for the body.
+PROCESS_HISTORY_SQL = f'''
+    WITH intervals AS (
+        SELECT 
+            {INTERVAL_START_SQL} as interval_start,
+            COALESCE(AVG(cpu_usage), 0.0) as avg_cpu,
+            COALESCE(MAX(cpu_usage), 0.0) as max_cpu,
+            COALESCE(MIN(cpu_usage), 0.0) as min_cpu,
+            COALESCE(AVG(memory_usage), 0.0) as avg_memory,
+            COALESCE(MAX(memory_usage), 0.0) as max_memory,
+            COALESCE(MIN(memory_usage), 0.0) as min_memory,
+            COUNT(CASE WHEN has_error = 1 THEN 1 END) as error_count,
+            COUNT(CASE WHEN has_warning = 1 THEN 1 END) as warning_count
+        FROM service_status 
+        WHERE service_name = ? 
+        AND timestamp BETWEEN ? AND ?
+        GROUP BY interval_start
+        ORDER BY interval_start ASC
+    )
+    SELECT json_object(
+        'process_name', ?,
+        'start_time', ?,
+        'end_time', ?,
+        'interval', ?,
+        'metrics', json_object(
+            'timestamps', json_group_array(interval_start),
+            'cpu', json_object(
+                'avg', json_group_array(avg_cpu),
+                'max', json_group_array(max_cpu),
+                'min', json_group_array(min_cpu)
+            ),
+            'memory', json_object(
+                'avg', json_group_array(avg_memory),
+                'max', json_group_array(max_memory),
+                'min', json_group_array(min_memory)
+            ),
+            'errors', json_group_array(error_count),
+            'warnings', json_group_array(warning_count)
+        ),
+        'statistics', CASE WHEN COUNT(*) = 0 THEN json_object('error', 'No data available') ELSE json_object(
+            'cpu', json_object(
+                'average', json_object('avg', ROUND(AVG(avg_cpu), 2), 'max', ROUND(MAX(avg_cpu), 2), 'min', ROUND(MIN(avg_cpu), 2), 'total_points', COUNT(*)),
+                'maximum', json_object('avg', ROUND(AVG(max_cpu), 2), 'max', ROUND(MAX(max_cpu), 2), 'min', ROUND(MIN(max_cpu), 2), 'total_points', COUNT(*)),
+                'minimum', json_object('avg', ROUND(AVG(min_cpu), 2), 'max', ROUND(MAX(min_cpu), 2), 'min', ROUND(MIN(min_cpu), 2), 'total_points', COUNT(*))
+            ),
+            'memory', json_object(
+                'average', json_object('avg', ROUND(AVG(avg_memory), 2), 'max', ROUND(MAX(avg_memory), 2), 'min', ROUND(MIN(avg_memory), 2), 'total_points', COUNT(*)),
+                'maximum', json_object('avg', ROUND(AVG(max_memory), 2), 'max', ROUND(MAX(max_memory), 2), 'min', ROUND(MIN(max_memory), 2), 'total_points', COUNT(*)),
+                'minimum', json_object('avg', ROUND(AVG(min_memory), 2), 'max', ROUND(MAX(min_memory), 2), 'min', ROUND(MIN(min_memory), 2), 'total_points', COUNT(*))
+            ),
+            'incidents', json_object(
+                'total_errors', SUM(error_count),
+                'total_warnings', SUM(warning_count)
+            )
+        ) END
+    )
+    FROM intervals
+'''
+
+# (upper bounds, colors) of each metric's bands, lowest first: a value's
+# color is the first band whose bound it does not exceed, else critical
+HEATMAP_COLOR_BANDS = {
+    metric: (
+        tuple(bands[level]['max'] for level in ('low', 'medium', 'high')),
+        tuple(bands[level]['color'] for level in ('low', 'medium', 'high', 'critical'))
+    )
+    for metric, bands in HEATMAP_THRESHOLDS.items()
+}
+
+# Epoch the metrics interval grid is aligned to. strftime('%s') reads the
+# stored local wall-clock timestamps as UTC, so the epoch is naive as well
+EPOCH = datetime(1970, 1, 1)
+
+@dataclass(slots=True)
+class HeatmapPoint:
+    """One heatmap data point, serialized by the HeatmapPoint model"""
+    timestamp: datetime
+    value: float
+    status: str
 
 def create_monitoring_routes(namespace, services):
     """Create routes for process monitoring"""
+
+    # One read-only connection per worker thread, kept open across requests
+    # so SQLite's page cache and prepared statement cache stay warm
+    monitoring_db = DatabaseConnection(services['config'].DB_PATH, read_only=True)
+
+    # Heatmap and historical data only change when the scheduler records new
+    # samples, so their encoded bodies are reused for a short while; each is
+    # stored with the monotonic time it was built at
+    response_cache = TTLCache(maxsize=MONITORING_RESPONSE_CACHE_SIZE)
+    response_cache_ttl = services['config'].MONITORING_RESPONSE_CACHE_TTL
+
+    def cached_json_response(key, build):
+        """Serve the cached body for ``key``, building and caching it on a miss"""
+        entry = response_cache.get(key)
+        cache_status = 'HIT'
+        if entry is None:
+            cache_status = 'MISS'
+            entry = response_cache.get_or_set(
+                key,
+                lambda: (time.monotonic(), build()),
+                response_cache_ttl
+            )
+        built_at, body = entry
+        response = json_response(body)
+        response.headers['X-Cache'] = cache_status
+        response.headers['Age'] = str(int(time.monotonic() - built_at))
+        return response
     
-    @namespace.route('/processes/<string:process_name>/monitoring')
+    @namespace.route('/processes/<pname:process_name>/monitoring')
     class ProcessMonitoring(Resource):
+        db = monitoring_db
+
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
             self.pm2_service = services['pm2_service']
             self.logger = services['logger']
+            self.config = services['config']
 
         @namespace.doc(
             params={
@@ -25,16 +221,21 @@ def create_monitoring_routes(namespace, services):
             responses={
                 200: 'Success',
                 404: 'Process not found',
+                400: 'Invalid parameters',
                 500: 'Internal server error'
             }
         )
-        @namespace.marshal_with(namespace.models['metrics'])
+        @marshal_fast(namespace, 'metrics')
         def get(self, process_name):
             """Get process monitoring metrics"""
             try:
                 # Get query parameters with defaults
                 timeframe = int(request.args.get('timeframe', 60))
                 interval = int(request.args.get('interval', 60))
+                if timeframe < 1 or interval < 1:
+                    raise ValueError("Timeframe and interval must be at least 1")
+                if timeframe * 60 // interval > self.config.MONITORING_MAX_POINTS:
+                    raise ValueError(f"Timeframe spans more than {self.config.MONITORING_MAX_POINTS} intervals")
                 
                 # Calculate time range
                 end_time = datetime.now()
@@ -51,106 +252,69 @@ def create_monitoring_routes(namespace, services):
                 # Calculate summary statistics
                 summary = self.calculate_metrics_summary(metrics)
 
-                return {
+                # The payload has exactly the ProcessMetrics fields and both
+                # raw fields pass through marshalling as is, so encode directly
+                return json_response({
                     'process_name': process_name,
                     'time_range': f'Last {timeframe} minutes',
                     'metrics': metrics,
                     'summary': summary
-                }
+                })
 
             except ProcessNotFoundError as e:
                 namespace.abort(404, str(e))
+            except ValueError as e:
+                namespace.abort(400, str(e))
             except Exception as e:
-                self.logger.error(f"Error getting metrics for {process_name}: {str(e)}")
-                namespace.abort(500, f"Internal server error: {str(e)}")
-
-
-
-    def get_process_metrics(self, process_name: str, time_range: int = 72) -> List[Dict]:
-        """Get process metrics with proper time intervals
-        
-        Args:
-            process_name: Name of the process
-            time_range: Hours of data to retrieve (default: 72)
-        """
-        conn = None
-        try:
-            conn = sqlite3.connect(self.config.DB_PATH)
-            cursor = conn.cursor()
-            end_time = datetime.now()
-            start_time = end_time - timedelta(hours=time_range)
-
-            # Query with proper time intervals
-            cursor.execute('''
-                WITH RECURSIVE 
-                TimePoints(time_point) AS (
-                    -- Generate time points at 1-minute intervals
-                    SELECT datetime(?, 'localtime')
-                    UNION ALL
-                    SELECT datetime(time_point, '+1 minute')
-                    FROM TimePoints
-                    WHERE time_point < datetime(?, 'localtime')
-                ),
-                ProcessMetrics AS (
-                    -- Get actual metrics data
-                    SELECT 
-                        strftime('%Y-%m-%dT%H:%M:00', timestamp) as metric_time,
-                        AVG(cpu_usage) as cpu,
-                        MAX(status) as status,
-                        MAX(has_error) as has_error
-                    FROM service_status
-                    WHERE service_name = ?
-                    AND timestamp BETWEEN datetime(?, 'localtime') AND datetime(?, 'localtime')
-                    GROUP BY metric_time
-                )
-                SELECT 
-                    TimePoints.time_point as timestamp,
-                    COALESCE(ProcessMetrics.cpu, 0) as value,
-                    CASE
-                        WHEN ProcessMetrics.has_error = 1 THEN 'red'
-                        WHEN ProcessMetrics.status = 0 THEN 'gray'
-                        WHEN ProcessMetrics.cpu > 90 THEN 'red'
-                        WHEN ProcessMetrics.cpu > 75 THEN 'orange'
-                        ELSE 'green'
-                    END as status
-                FROM TimePoints
-                LEFT JOIN ProcessMetrics ON TimePoints.time_point = ProcessMetrics.metric_time
-                ORDER BY TimePoints.time_point
-            ''', (
-                start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                end_time.strftime('%Y-%m-%d %H:%M:%S'),
+                message = str(e)
+                self.logger.error(f"Error getting metrics for {process_name}: {message}")
+                namespace.abort(500, f"Internal server error: {message}")
+
+        def get_process_metrics(self, process_name, start_time, end_time, interval):
+            """Get process metrics as parallel series, one entry per ``interval`` seconds
+
+            Only intervals that have samples come back from SQLite; the grid
+            of interval starts between them is filled in here, with intervals
+            without samples reported as zero and green.
+            """
+            cursor = self.db.get_connection().cursor()
+            cursor.execute(PROCESS_METRICS_SQL, (
+                interval,
                 process_name,
                 start_time.strftime('%Y-%m-%d %H:%M:%S'),
                 end_time.strftime('%Y-%m-%d %H:%M:%S')
             ))
-
-            rows = cursor.fetchall()
-            
-            # Format the response
-            metrics = [
-                {
-                    'timestamp': row[0],
-                    'value': float(row[1]) if row[1] is not None else 0.0,
-                    'status': row[2]
-                }
-                for row in rows
-            ]
-
-            return {
-                'process_name': process_name,
-                'start_time': start_time.isoformat(),
-                'end_time': end_time.isoformat(),
-                'interval': '1 minute',
-                'data': metrics
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error getting metrics for {process_name}: {str(e)}")
-            raise
-        finally:
-            if conn:
-                conn.close()
-
+            buckets = {row[0]: row[1:] for row in cursor.fetchall()}
+
+            metrics = {'timestamps': [], 'cpu': [], 'memory': [], 'errors': [], 'warnings': [], 'status': []}
+            step = timedelta(seconds=interval)
+            # Interval starts are aligned to the epoch, as in INTERVAL_START_SQL
+            time_point = start_time.replace(microsecond=0)
+            time_point -= timedelta(seconds=(time_point - EPOCH) // timedelta(seconds=1) % interval)
+            while time_point <= end_time:
+                interval_start = time_point.strftime('%Y-%m-%d %H:%M:%S')
+                cpu, memory, status, has_error, errors, warnings = buckets.get(
+                    interval_start, (None, None, None, None, 0, 0)
+                )
+                if has_error == 1:
+                    color = 'red'
+                elif status == 0:
+                    color = 'gray'
+                elif cpu is not None and cpu > 90:
+                    color = 'red'
+                elif cpu is not None and cpu > 75:
+                    color = 'orange'
+                else:
+                    color = 'green'
+                metrics['timestamps'].append(interval_start)
+                metrics['cpu'].append(cpu or 0.0)
+                metrics['memory'].append(memory or 0.0)
+                metrics['errors'].append(errors)
+                metrics['warnings'].append(warnings)
+                metrics['status'].append(color)
+                time_point += step
+
+            return metrics
 
         def calculate_metrics_summary(self, metrics):
             """Calculate summary statistics for metrics"""
@@ -172,14 +336,13 @@ def create_monitoring_routes(namespace, services):
                 },
                 'errors': sum(metrics['errors']),
                 'warnings': sum(metrics['warnings']),
-                'status_distribution': {
-                    status: metrics['status'].count(status)
-                    for status in set(metrics['status'])
-                }
+                'status_distribution': dict(Counter(metrics['status']))
             }
 
-    @namespace.route('/processes/<string:process_name>/status')
+    @namespace.route('/processes/<pname:process_name>/status')
     class ProcessStatus(Resource):
+        db = monitoring_db
+
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
             self.pm2_service = services['pm2_service']
@@ -192,15 +355,15 @@ def create_monitoring_routes(namespace, services):
                 500: 'Internal server error'
             }
         )
-        @namespace.marshal_with(namespace.models['status'])
+        @marshal_fast(namespace, 'status')
         def get(self, process_name):
             """Get current process status"""
             try:
-                # Get process info from PM2
+                # Get recent errors from database while PM2 is asked for
+                # the process info
+                errors_future = status_pool.submit(self.get_recent_errors, process_name)
                 process = self.pm2_service.get_process(process_name)
-                
-                # Get recent errors from database
-                recent_errors = self.get_recent_errors(process_name)
+                recent_errors = errors_future.result()
                 
                 # Format response
                 monit_data = process.get('monit', {})
@@ -226,45 +389,36 @@ def create_monitoring_routes(namespace, services):
             except ProcessNotFoundError as e:
                 namespace.abort(404, str(e))
             except Exception as e:
-                self.logger.error(f"Error getting status for {process_name}: {str(e)}")
-                namespace.abort(500, f"Internal server error: {str(e)}")
+                message = str(e)
+                self.logger.error(f"Error getting status for {process_name}: {message}")
+                namespace.abort(500, f"Internal server error: {message}")
 
         def get_recent_errors(self, process_name, hours=24):
             """Get recent errors from database"""
-            conn = sqlite3.connect(Config.DB_PATH)
-            try:
-                cursor = conn.cursor()
-                start_time = datetime.now() - timedelta(hours=hours)
-                
-                cursor.execute('''
-                    SELECT timestamp, status, has_error, has_warning
-                    FROM service_status 
-                    WHERE service_name = ? 
-                    AND timestamp >= ?
-                    AND (has_error = 1 OR has_warning = 1)
-                    ORDER BY timestamp DESC
-                ''', (
-                    process_name,
-                    start_time.strftime('%Y-%m-%d %H:%M:%S')
-                ))
-                
-                rows = cursor.fetchall()
-                
-                return [{
-                    'timestamp': datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S'),
-                    'type': 'error' if row[2] else 'warning',
-                    'details': {
-                        'status_code': row[1],
-                        'is_error': bool(row[2]),
-                        'is_warning': bool(row[3])
-                    }
-                } for row in rows]
-                
-            finally:
-                conn.close()
+            cursor = self.db.get_connection().cursor()
+            start_time = datetime.now() - timedelta(hours=hours)
+            
+            cursor.execute(RECENT_ERRORS_SQL, (
+                process_name,
+                start_time.strftime('%Y-%m-%d %H:%M:%S')
+            ))
+            
+            rows = cursor.fetchall()
+            
+            return [{
+                'timestamp': datetime.fromisoformat(row[0]),
+                'type': 'error' if row[2] else 'warning',
+                'details': {
+                    'status_code': row[1],
+                    'is_error': bool(row[2]),
+                    'is_warning': bool(row[3])
+                }
+            } for row in rows]
 
-    @namespace.route('/processes/<string:process_name>/heatmap')
+    @namespace.route('/processes/<pname:process_name>/heatmap')
     class ProcessHeatmap(Resource):
+        db = monitoring_db
+
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
             self.pm2_service = services['pm2_service']
@@ -273,7 +427,7 @@ def create_monitoring_routes(namespace, services):
 
         @namespace.doc(
             params={
-                'metric': {'description': 'Metric to visualize (cpu/memory)', 'enum': ['cpu', 'memory']},
+                'metric': {'description': 'Metric to visualize (cpu/memory)', 'enum': HEATMAP_METRICS},
                 'period': {'description': 'Time period in hours', 'type': 'integer', 'default': 72},
                 'interval': {'description': 'Aggregation interval in minutes', 'type': 'integer', 'default': 15}
             },
@@ -284,117 +438,117 @@ def create_monitoring_routes(namespace, services):
                 500: 'Internal server error'
             }
         )
-        @namespace.marshal_with(namespace.models['heatmap'])
+        @revalidated
+        @marshal_fast(namespace, 'heatmap', formats={'columnar': 'heatmap_columnar'})
         def get(self, process_name):
             """Get process metric heatmap data"""
             try:
                 metric = request.args.get('metric', 'cpu')
                 period = int(request.args.get('period', 72))
                 interval = int(request.args.get('interval', 15))
+                if interval < 1:
+                    raise ValueError("Interval must be at least 1 minute")
 
-                if metric not in ['cpu', 'memory']:
+                if metric not in HEATMAP_METRICS:
                     raise ValueError("Invalid metric type")
 
-                # Define thresholds for colors
-                thresholds = self._get_metric_thresholds(metric)
-                
-                # Get heatmap data
-                data = self._get_heatmap_data(
-                    process_name, 
-                    metric, 
-                    period, 
-                    interval,
-                    thresholds
+                columnar = request.args.get('format') == 'columnar'
+                return cached_json_response(
+                    ('heatmap', process_name, metric, period, interval, columnar),
+                    lambda: self._build_heatmap(process_name, metric, period, interval, columnar)
                 )
 
-                return {
-                    'process_name': process_name,
-                    'metric_type': metric,
-                    'time_range': f'Last {period} hours',
-                    'interval': f'{interval} minutes',
-                    'thresholds': thresholds,
-                    'data': data
-                }
-
             except ProcessNotFoundError as e:
                 namespace.abort(404, str(e))
             except ValueError as e:
                 namespace.abort(400, str(e))
             except Exception as e:
-                self.logger.error(f"Error getting heatmap for {process_name}: {str(e)}")
-                namespace.abort(500, str(e))
+                message = str(e)
+                self.logger.error(f"Error getting heatmap for {process_name}: {message}")
+                namespace.abort(500, message)
+
+        def _build_heatmap(self, process_name, metric, period, interval, columnar):
+            """Query and encode a heatmap response body"""
+            # Define thresholds for colors
+            thresholds = self._get_metric_thresholds(metric)
+            
+            # Get heatmap data
+            rows = self._get_heatmap_data(
+                process_name, 
+                metric, 
+                period, 
+                interval
+            )
+            bands = HEATMAP_COLOR_BANDS[metric]
+            if columnar:
+                data = self._format_columns(rows, bands)
+            else:
+                data = self._format_points(rows, bands)
+
+            # Every part of the payload already has its model's exact shape
+            # (HeatmapPoint dataclasses included), so encode it directly
+            return encode_json({
+                'process_name': process_name,
+                'metric_type': metric,
+                'time_range': f'Last {period} hours',
+                'interval': f'{interval} minutes',
+                'thresholds': thresholds,
+                'data': data
+            })
 
         def _get_metric_thresholds(self, metric):
             """Get thresholds for metric coloring"""
-            if metric == 'cpu':
-                return {
-                    'low': {'max': 30, 'color': 'green'},
-                    'medium': {'max': 70, 'color': 'yellow'},
-                    'high': {'max': 90, 'color': 'orange'},
-                    'critical': {'color': 'red'}
-                }
-            else:  # memory
-                return {
-                    'low': {'max': 256, 'color': 'green'},  # MB
-                    'medium': {'max': 512, 'color': 'yellow'},
-                    'high': {'max': 1024, 'color': 'orange'},
-                    'critical': {'color': 'red'}
-                }
+            return HEATMAP_THRESHOLDS[metric]
 
-        def _get_heatmap_data(self, process_name, metric, period, interval, thresholds):
+        def _get_heatmap_data(self, process_name, metric, period, interval):
             """Get aggregated data for heatmap"""
-            conn = sqlite3.connect(self.config.DB_PATH)
-            try:
-                cursor = conn.cursor()
-                end_time = datetime.now()
-                start_time = end_time - timedelta(hours=period)
-                
-                # Query with proper aggregation
-                cursor.execute(f'''
-                    WITH intervals AS (
-                        SELECT 
-                            strftime('%Y-%m-%d %H:%M:00', timestamp) as interval_start,
-                            AVG({"cpu_usage" if metric == "cpu" else "memory_usage"}) as avg_value,
-                            MAX(has_error) as had_error,
-                            MAX(has_warning) as had_warning
-                        FROM service_status 
-                        WHERE service_name = ? 
-                        AND timestamp BETWEEN ? AND ?
-                        GROUP BY interval_start
-                        ORDER BY interval_start ASC
-                    )
-                    SELECT * FROM intervals
-                ''', (
-                    process_name,
-                    start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                    end_time.strftime('%Y-%m-%d %H:%M:%S')
-                ))
-                
-                rows = cursor.fetchall()
-                
-                return [{
-                    'timestamp': datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S'),
-                    'value': float(row[1]) if row[1] is not None else 0.0,
-                    'status': self._get_value_color(float(row[1]) if row[1] is not None else 0.0, thresholds),
-                    'had_error': bool(row[2]),
-                    'had_warning': bool(row[3])
-                } for row in rows]
-                
-            finally:
-                conn.close()
-
-        def _get_value_color(self, value, thresholds):
-            """Determine color based on value and thresholds"""
-            if value <= thresholds['low']['max']:
-                return thresholds['low']['color']
-            elif value <= thresholds['medium']['max']:
-                return thresholds['medium']['color']
-            elif value <= thresholds['high']['max']:
-                return thresholds['high']['color']
-            return thresholds['critical']['color']
-
-    @namespace.route('/processes/<string:process_name>/historical')
+            cursor = self.db.get_connection().cursor()
+            end_time = datetime.now()
+            start_time = end_time - timedelta(hours=period)
+            
+            # Query with proper aggregation
+            cursor.execute(HEATMAP_SQL[metric], (
+                interval * 60,
+                process_name,
+                start_time.strftime('%Y-%m-%d %H:%M:%S'),
+                end_time.strftime('%Y-%m-%d %H:%M:%S')
+            ))
+            
+            return cursor.fetchall()
+
+        def _format_points(self, rows, bands):
+            """Format heatmap rows as one HeatmapPoint per data point"""
+            return [
+                HeatmapPoint(
+                    timestamp=datetime.fromisoformat(timestamp),
+                    value=value,
+                    status=self._get_value_color(value, bands)
+                )
+                for timestamp, value, _, _ in rows
+            ]
+
+        def _format_columns(self, rows, bands):
+            """Format heatmap rows as parallel timestamp/value/status arrays"""
+            timestamps, values, _, _ = zip(*rows) if rows else ((), (), (), ())
+            bounds, colors = bands
+            return {
+                'timestamps': [
+                    int(datetime.fromisoformat(timestamp).timestamp() * 1000)
+                    for timestamp in timestamps
+                ],
+                'values': list(values),
+                'status': [colors[bisect_left(bounds, value)] for value in values]
+            }
+
+        def _get_value_color(self, value, bands):
+            """Determine color based on value and the metric's color bands"""
+            bounds, colors = bands
+            return colors[bisect_left(bounds, value)]
+
+    @namespace.route('/processes/<pname:process_name>/historical')
     class ProcessHistorical(Resource):
+        db = monitoring_db
+
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
             self.pm2_service = services['pm2_service']
@@ -408,7 +562,8 @@ def create_monitoring_routes(namespace, services):
                 'interval': {'description': 'Aggregation interval in minutes', 'type': 'integer', 'default': 60}
             }
         )
-        @namespace.marshal_with(namespace.models['historical'])
+        @revalidated
+        @marshal_fast(namespace, 'historical')
         def get(self, process_name):
             """Get historical metrics for specific time range"""
             try:
@@ -416,109 +571,41 @@ def create_monitoring_routes(namespace, services):
                 end_time = datetime.fromisoformat(request.args.get('end', datetime.now().isoformat()))
                 start_time = datetime.fromisoformat(request.args.get('start', (end_time - timedelta(days=7)).isoformat()))
                 interval = int(request.args.get('interval', 60))
-
-                # Get historical data
-                metrics_data = self._get_historical_data(process_name, start_time, end_time, interval)
-                
-                # Calculate statistics
-                statistics = self._calculate_statistics(metrics_data)
-
-                return {
-                    'process_name': process_name,
-                    'start_time': start_time,
-                    'end_time': end_time,
-                    'interval': f'{interval} minutes',
-                    'metrics': metrics_data,
-                    'statistics': statistics
-                }
+                if interval < 1:
+                    raise ValueError("Interval must be at least 1 minute")
+
+                # Samples are recorded once a minute, so the range is widened to
+                # whole minutes, keeping the current partial one; requests
+                # within the same minutes share an entry
+                start_time = start_time.replace(second=0, microsecond=0)
+                end_time = end_time.replace(second=59, microsecond=0)
+                return cached_json_response(
+                    ('historical', process_name, start_time, end_time, interval),
+                    lambda: self._build_historical(process_name, start_time, end_time, interval)
+                )
 
             except ProcessNotFoundError as e:
                 namespace.abort(404, str(e))
             except ValueError as e:
                 namespace.abort(400, str(e))
             except Exception as e:
-                self.logger.error(f"Error getting historical data for {process_name}: {str(e)}")
-                namespace.abort(500, str(e))
-
-        def _get_historical_data(self, process_name, start_time, end_time, interval):
-            """Get historical metrics with aggregation"""
-            conn = sqlite3.connect(self.config.DB_PATH)
-            try:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    WITH intervals AS (
-                        SELECT 
-                            strftime('%Y-%m-%d %H:%M:00', timestamp) as interval_start,
-                            AVG(cpu_usage) as avg_cpu,
-                            MAX(cpu_usage) as max_cpu,
-                            MIN(cpu_usage) as min_cpu,
-                            AVG(memory_usage) as avg_memory,
-                            MAX(memory_usage) as max_memory,
-                            MIN(memory_usage) as min_memory,
-                            COUNT(CASE WHEN has_error = 1 THEN 1 END) as error_count,
-                            COUNT(CASE WHEN has_warning = 1 THEN 1 END) as warning_count
-                        FROM service_status 
-                        WHERE service_name = ? 
-                        AND timestamp BETWEEN ? AND ?
-                        GROUP BY interval_start
-                        ORDER BY interval_start ASC
-                    )
-                    SELECT * FROM intervals
-                ''', (
-                    process_name,
-                    start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                    end_time.strftime('%Y-%m-%d %H:%M:%S')
-                ))
-                
-                rows = cursor.fetchall()
-                
-                return {
-                    'timestamps': [row[0] for row in rows],
-                    'cpu': {
-                        'avg': [float(row[1]) if row[1] is not None else 0.0 for row in rows],
-                        'max': [float(row[2]) if row[2] is not None else 0.0 for row in rows],
-                        'min': [float(row[3]) if row[3] is not None else 0.0 for row in rows]
-                    },
-                    'memory': {
-                        'avg': [float(row[4]) if row[4] is not None else 0.0 for row in rows],
-                        'max': [float(row[5]) if row[5] is not None else 0.0 for row in rows],
-                        'min': [float(row[6]) if row[6] is not None else 0.0 for row in rows]
-                    },
-                    'errors': [int(row[7]) for row in rows],
-                    'warnings': [int(row[8]) for row in rows]
-                }
-                
-            finally:
-                conn.close()
-
-        def _calculate_statistics(self, data):
-            """Calculate statistical summary of historical data"""
-            if not data['timestamps']:
-                return {'error': 'No data available'}
-
-            def calc_stats(values):
-                return {
-                    'avg': round(sum(values) / len(values), 2),
-                    'max': round(max(values), 2),
-                    'min': round(min(values), 2),
-                    'total_points': len(values)
-                }
-
-            return {
-                'cpu': {
-                    'average': calc_stats(data['cpu']['avg']),
-                    'maximum': calc_stats(data['cpu']['max']),
-                    'minimum': calc_stats(data['cpu']['min'])
-                },
-                'memory': {
-                    'average': calc_stats(data['memory']['avg']),
-                    'maximum': calc_stats(data['memory']['max']),
-                    'minimum': calc_stats(data['memory']['min'])
-                },
-                'incidents': {
-                    'total_errors': sum(data['errors']),
-                    'total_warnings': sum(data['warnings'])
-                }
-            }
+                message = str(e)
+                self.logger.error(f"Error getting historical data for {process_name}: {message}")
+                namespace.abort(500, message)
+
+        def _build_historical(self, process_name, start_time, end_time, interval):
+            """Query a historical response body, encoded by SQLite"""
+            cursor = self.db.get_connection().cursor()
+            cursor.execute(PROCESS_HISTORY_SQL, (
+                interval * 60,
+                process_name,
+                start_time.strftime('%Y-%m-%d %H:%M:%S'),
+                end_time.strftime('%Y-%m-%d %H:%M:%S'),
+                process_name,
+                start_time.isoformat(),
+                end_time.isoformat(),
+                f'{interval} minutes'
+            ))
+            return cursor.fetchone()[0].encode()
 
     return None
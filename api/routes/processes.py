@@ -1,23 +1,55 @@
 # /api/routes/processes.py
 
-from datetime import datetime
-from pathlib import Path
+import os
+from flask import request
 from flask_restx import Resource
+from api.models.error import error_response
+from api.models.serializers import fast_serializer
+from api.representations import json_response, stream_json_array
 from core.exceptions import ProcessNotFoundError, ProcessAlreadyExistsError, PM2CommandError
 
+# HTTP status for exceptions raised by the process services; anything else is a 500
+ERROR_STATUS = {
+    ProcessNotFoundError: 404,
+    ProcessAlreadyExistsError: 409,
+}
+
+# POST /<process_name>/<action>: PM2Service method and past tense for the message
+PROCESS_ACTIONS = {
+    'start': ('start_process', 'started'),
+    'stop': ('stop_process', 'stopped'),
+    'restart': ('restart_process', 'restarted'),
+}
+
+def process_error(e, process_name, message=None):
+    """Error payload and status for an exception raised while handling ``process_name``
+
+    Mapped errors name the process in ``details``; 500s carry no details.
+    """
+    status = ERROR_STATUS.get(type(e), 500)
+    details = None if status == 500 else {'process_name': process_name}
+    return error_response(e, details, message), status
+
 def create_process_routes(namespace, services=None):
     """Create process management routes"""
     
+    # Config file paths are built once per process on every list request,
+    # so keep the directory as a plain string rather than a Path
+    config_dir = os.fspath(services['config'].PM2_CONFIG_DIR)
+    
+    class PM2Resource(Resource):
+        """Base resource with the shared services bound once as class attributes"""
+        pm2_service = services['pm2_service']
+        process_manager = services['process_manager']
+        logger = services['logger']
+        config = services['config']
+    
     @namespace.route('/')
-    class ProcessList(Resource):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.pm2_service = services['pm2_service']
-            self.process_manager = services['process_manager']
-            self.logger = services['logger']
-            self.config = services['config']
-
+    class ProcessList(PM2Resource):
         @namespace.doc(
+            params={
+                'format': {'description': 'Response layout', 'enum': ['columnar'], 'type': 'string'}
+            },
             responses={
                 200: 'Success',
                 500: 'Internal server error'
@@ -28,32 +60,55 @@ def create_process_routes(namespace, services=None):
             try:
                 processes = self.pm2_service.list_processes()
                 
-                # Add config file paths to process details
-                for process in processes:
-                    try:
-                        pm2_config = Path(f"{self.config.PM2_CONFIG_DIR}/{process['name']}.config.js")
-                        python_config = Path(f"{self.config.PM2_CONFIG_DIR}/{process['name']}.ini")
-                        
-                        process['config_files'] = {
-                            'pm2_config': str(pm2_config) if pm2_config.exists() else None,
-                            'python_config': str(python_config) if python_config.exists() else None
-                        }
-                    except Exception as e:
-                        self.logger.warning(f"Error getting config paths for process {process['name']}: {str(e)}")
+                if request.args.get('format') == 'columnar':
+                    return fast_serializer(namespace.models['process_columnar'])(self._to_columns(processes))
+                
+                # Read the config directory once instead of probing two files per process
+                config_names = self._list_config_names()
                 
-                return processes
+                return stream_json_array(self._with_config_files(processes, config_names))
                 
             except Exception as e:
-                self.logger.error(f"Error getting process list: {str(e)}")
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {
-                        'command': 'pm2 jlist',
-                        'error_details': str(e)
+                message = str(e)
+                self.logger.error(f"Error getting process list: {message}")
+                return error_response(e, {
+                    'command': 'pm2 jlist',
+                    'error_details': message
+                }, message), 500
+
+        def _with_config_files(self, processes, config_names):
+            """Yield each process with its config file paths added"""
+            for process in processes:
+                try:
+                    pm2_config = f"{process['name']}.config.js"
+                    python_config = f"{process['name']}.ini"
+                    
+                    process['config_files'] = {
+                        'pm2_config': f"{config_dir}/{pm2_config}" if pm2_config in config_names else None,
+                        'python_config': f"{config_dir}/{python_config}" if python_config in config_names else None
                     }
-                }, 500
+                except Exception as e:
+                    self.logger.warning(f"Error getting config paths for process {process['name']}: {str(e)}")
+                yield process
+
+        def _list_config_names(self):
+            """Get the names of the files in the config directory"""
+            try:
+                with os.scandir(config_dir) as entries:
+                    return {entry.name for entry in entries}
+            except FileNotFoundError:
+                return set()
+
+        def _to_columns(self, processes):
+            """Transpose PM2 process entries into parallel arrays"""
+            monits = [process.get('monit') or {} for process in processes]
+            return {
+                'pid': [process.get('pid') for process in processes],
+                'name': [process.get('name') for process in processes],
+                'cpu': [monit.get('cpu') for monit in monits],
+                'memory': [monit.get('memory') for monit in monits],
+                'status': [(process.get('pm2_env') or {}).get('status') for process in processes]
+            }
 
         @namespace.doc(
             responses={
@@ -69,29 +124,14 @@ def create_process_routes(namespace, services=None):
             try:
                 result = self.process_manager.create_process(namespace.payload)
                 return result, 201
-            except ProcessAlreadyExistsError as e:
-                return {
-                    'error': str(e),
-                    'error_type': 'ProcessAlreadyExistsError',
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': namespace.payload.get('name')}
-                }, 409
             except Exception as e:
-                self.logger.error(f"Error creating process: {str(e)}")
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': None
-                }, 500
-
-    @namespace.route('/<string:process_name>')
-    class Process(Resource):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.pm2_service = services['pm2_service']
-            self.logger = services['logger']
+                message = str(e)
+                if type(e) not in ERROR_STATUS:
+                    self.logger.error(f"Error creating process: {message}")
+                return process_error(e, namespace.payload.get('name'), message)
 
+    @namespace.route('/<pname:process_name>')
+    class Process(PM2Resource):
         @namespace.doc(
             responses={
                 200: 'Success',
@@ -103,151 +143,39 @@ def create_process_routes(namespace, services=None):
             """Get details of a specific process"""
             try:
                 return self.pm2_service.get_process(process_name)
-            except ProcessNotFoundError as e:
-                return {
-                    'error': str(e),
-                    'error_type': 'ProcessNotFoundError',
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 404
             except Exception as e:
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': None
-                }, 500
+                return process_error(e, process_name)
 
         def delete(self, process_name):
             """Delete a specific process"""
             try:
                 self.pm2_service.delete_process(process_name)
-                return {"message": f"Process {process_name} deleted successfully"}
-            except ProcessNotFoundError as e:
-                return {
-                    'error': str(e),
-                    'error_type': 'ProcessNotFoundError',
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 404
+                return json_response({"message": f"Process {process_name} deleted successfully"})
             except Exception as e:
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': None
-                }, 500
+                return process_error(e, process_name)
 
-            
-    @namespace.route('/<string:process_name>/start')
-    class ProcessStart(Resource):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.pm2_service = services['pm2_service']
-            self.logger = services['logger']
 
+    @namespace.route(f"/<pname:process_name>/<any({', '.join(PROCESS_ACTIONS)}):action>")
+    @namespace.param('action', 'Action to run', enum=list(PROCESS_ACTIONS))
+    class ProcessControl(PM2Resource):
         @namespace.doc(
             responses={
-                200: 'Process started',
+                200: 'Action completed',
                 404: 'Process not found',
                 500: 'Internal server error'
             }
         )
-        def post(self, process_name):
-            """Start a specific process"""
+        def post(self, process_name, action):
+            """Start, stop or restart a specific process"""
+            method, done = PROCESS_ACTIONS[action]
             try:
-                self.pm2_service.start_process(process_name)
-                return {"message": f"Process {process_name} started successfully"}
-            except ProcessNotFoundError as e:
-                return {
-                    'error': str(e),
-                    'error_type': 'ProcessNotFoundError',
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 404
+                getattr(self.pm2_service, method)(process_name)
+                return json_response({"message": f"Process {process_name} {done} successfully"})
             except Exception as e:
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': None
-                }, 500
-
-    @namespace.route('/<string:process_name>/stop')
-    class ProcessStop(Resource):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.pm2_service = services['pm2_service']
-            self.logger = services['logger']
-
-        @namespace.doc(
-            responses={
-                200: 'Process stopped',
-                404: 'Process not found',
-                500: 'Internal server error'
-            }
-        )
-        def post(self, process_name):
-            """Stop a specific process"""
-            try:
-                self.pm2_service.stop_process(process_name)
-                return {"message": f"Process {process_name} stopped successfully"}
-            except ProcessNotFoundError as e:
-                return {
-                    'error': str(e),
-                    'error_type': 'ProcessNotFoundError',
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 404
-            except Exception as e:
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': None
-                }, 500
-
-    @namespace.route('/<string:process_name>/restart')
-    class ProcessRestart(Resource):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.pm2_service = services['pm2_service']
-            self.logger = services['logger']
-
-        @namespace.doc(
-            responses={
-                200: 'Process restarted',
-                404: 'Process not found',
-                500: 'Internal server error'
-            }
-        )
-        def post(self, process_name):
-            """Restart a specific process"""
-            try:
-                self.pm2_service.restart_process(process_name)
-                return {"message": f"Process {process_name} restarted successfully"}
-            except ProcessNotFoundError as e:
-                return {
-                    'error': str(e),
-                    'error_type': 'ProcessNotFoundError',
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 404
-            except Exception as e:
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': None
-                }, 500
-
-    @namespace.route('/<string:process_name>/update')
-    class ProcessUpdate(Resource):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.process_manager = services['process_manager']
-            self.logger = services['logger']
+                return process_error(e, process_name)
 
+    @namespace.route('/<pname:process_name>/update')
+    class ProcessUpdate(PM2Resource):
         @namespace.doc(
             responses={
                 200: "Process updated successfully",
@@ -260,39 +188,16 @@ def create_process_routes(namespace, services=None):
             try:
                 result = self.process_manager.update_process(process_name)
                 return result, 200
-            except ProcessNotFoundError as e:
-                return {
-                    "error": str(e),
-                    "error_type": "ProcessNotFoundError",
-                    "timestamp": datetime.now().isoformat(),
-                    "details": {"process_name": process_name}
-                }, 404
-            except PM2CommandError as e:
-                return {
-                    "error": str(e),
-                    "error_type": "PM2CommandError",
-                    "timestamp": datetime.now().isoformat(),
-                    "details": {
-                        "process_name": process_name,
-                        "command_output": str(e)
-                    }
-                }, 500
             except Exception as e:
-                return {
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "timestamp": datetime.now().isoformat(),
-                    "details": {"process_name": process_name}
-                }, 500
+                message = str(e)
+                details = {"process_name": process_name}
+                if isinstance(e, PM2CommandError):
+                    details["command_output"] = message
+                return error_response(e, details, message), ERROR_STATUS.get(type(e), 500)
 
    
-    @namespace.route('/<string:process_name>/config')
-    class ProcessConfigUpdate(Resource):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.process_manager = services['process_manager']
-            self.logger = services['logger']
-        
+    @namespace.route('/<pname:process_name>/config')
+    class ProcessConfigUpdate(PM2Resource):
         @namespace.doc(
             responses={
                 200: 'Current configuration',
@@ -306,22 +211,12 @@ def create_process_routes(namespace, services=None):
                 config = self.process_manager.get_process_config(process_name)
                 return config
                 
-            except ProcessNotFoundError as e:
-                return {
-                    'error': str(e),
-                    'error_type': 'ProcessNotFoundError',
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 404
-                
             except Exception as e:
-                self.logger.error(f"Error getting config for {process_name}: {str(e)}")
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 500
+                status = ERROR_STATUS.get(type(e), 500)
+                message = str(e)
+                if status == 500:
+                    self.logger.error(f"Error getting config for {process_name}: {message}")
+                return error_response(e, {'process_name': process_name}, message), status
 
         @namespace.doc(
             responses={
@@ -337,22 +232,12 @@ def create_process_routes(namespace, services=None):
                 result = self.process_manager.update_config(process_name, namespace.payload)
                 return result
                 
-            except ProcessNotFoundError as e:
-                return {
-                    'error': str(e),
-                    'error_type': 'ProcessNotFoundError',
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 404
-                
             except Exception as e:
-                self.logger.error(f"Error updating config for {process_name}: {str(e)}")
-                return {
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat(),
-                    'details': {'process_name': process_name}
-                }, 500
+                status = ERROR_STATUS.get(type(e), 500)
+                message = str(e)
+                if status == 500:
+                    self.logger.error(f"Error updating config for {process_name}: {message}")
+                return error_response(e, {'process_name': process_name}, message), status
 
 
     return None
\ No newline at end of file
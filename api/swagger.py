@@ -0,0 +1,39 @@
+# api/swagger.py
+
+import gzip
+from http import HTTPStatus
+
+import orjson
+from flask import Response, request
+
+from api.representations import JSON_OPTIONS
+
+
+def serve_cached_spec(app, api):
+    """Serve swagger.json from bytes encoded (and gzipped) once
+
+    The spec is built on the first request rather than at startup so lazily
+    registered models are only built when the docs are actually used.
+    Models do not change after startup, so the bytes never go stale.
+    """
+    cache = {}
+
+    def specs():
+        if not cache:
+            schema = api.__schema__
+            if 'error' in schema:
+                return Response(orjson.dumps(schema, option=JSON_OPTIONS),
+                                HTTPStatus.INTERNAL_SERVER_ERROR, mimetype='application/json')
+            body = orjson.dumps(schema, option=JSON_OPTIONS)
+            cache['identity'] = body
+            cache['gzip'] = gzip.compress(body, 6)
+
+        if request.accept_encodings['gzip']:
+            resp = Response(cache['gzip'], mimetype='application/json')
+            resp.headers['Content-Encoding'] = 'gzip'
+        else:
+            resp = Response(cache['identity'], mimetype='application/json')
+        resp.vary.add('Accept-Encoding')
+        return resp
+
+    app.view_functions[api.endpoint('specs')] = specs
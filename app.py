@@ -20,10 +20,17 @@ from services.host.monitor import HostMonitor
 from api.models.process import create_api_models
 from api.models.error import create_error_models
 from api.models.host import create_host_models
+from api.models.health import create_health_models
+from api.models.logs import create_log_models
+from api.models._common import ModelRegistry
 from api.routes.processes import create_process_routes
 from api.routes.health import create_health_routes
 from api.routes.logs import create_log_routes
 from api.routes.host import create_host_routes
+from api.representations import OrjsonProvider, output_json
+from api.swagger import serve_cached_spec
+from api.compression import init_response_compression
+from api.converters import init_url_converters
 
 def ensure_venv():
     """Ensure we're running inside the virtual environment"""
@@ -49,7 +56,9 @@ ensure_venv()
 def create_app():
     """Create and configure the Flask application"""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.wsgi_app = ProxyFix(app.wsgi_app)
+    init_url_converters(app)
     
     # Load configuration and setup logging
     config = Config()
@@ -71,6 +80,7 @@ def create_app():
         doc='/',
         prefix='/api'
     )
+    api.representations['application/json'] = output_json
     
     # Configure CORS
     CORS(app, resources={
@@ -99,11 +109,14 @@ def create_app():
         
         return response
     
+    init_response_compression(app, config)
+    
     # Initialize services
+    pm2_service = PM2Service(config, logger)
     services = {
-        'pm2_service': PM2Service(config, logger),
+        'pm2_service': pm2_service,
         'process_manager': ProcessManager(config, logger),
-        'log_manager': LogManager(config, logger),
+        'log_manager': LogManager(config, logger, pm2_service),
         'host_monitor': HostMonitor(config, logger),
         'logger': logger,
         'config': config
@@ -118,16 +131,14 @@ def create_app():
         'monitoring': api.namespace('monitoring', description='Process monitoring')
     }
     
-    # Register models
-    models = {
-        **create_api_models(api),
-        **create_monitoring_models(api),
-        'error': create_error_models(api),
-        **create_host_models(api)
-    }
-    
-    for name, model in models.items():
-        api.models[name] = model
+    # Register models; each one is built on first use by a route or the Swagger spec
+    api.models = ModelRegistry(api.models)
+    api.models.add_lazy(create_api_models(api))
+    api.models.add_lazy(create_monitoring_models(api))
+    api.models.add_lazy(create_host_models(api))
+    api.models.add_lazy(create_health_models(api))
+    api.models.add_lazy(create_log_models(api))
+    api.models['error'] = create_error_models(api)
     
     # Share models with namespaces
     for ns in namespaces.values():
@@ -135,10 +146,11 @@ def create_app():
     
     # Register routes
     create_process_routes(namespaces['processes'], services)
-    create_health_routes(namespaces['health'], services)
+    app.health_poller = create_health_routes(namespaces['health'], services)
     create_log_routes(namespaces['logs'], services)
     create_monitoring_routes(namespaces['monitoring'], services)
     create_host_routes(namespaces['host'], services)
+    serve_cached_spec(app, api)
 
     # Initialize scheduler
     scheduler = MonitoringScheduler(config, services, logger)
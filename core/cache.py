@@ -0,0 +1,116 @@
+# core/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+# (second, ISO string) of the last timestamp, reused within the same second
+_last_timestamp = (None, None)
+
+
+def now_iso() -> str:
+    """Current local time as an ISO 8601 string to the second
+
+    Response timestamps are formatted at most once per second instead of
+    building and formatting a datetime on every call.
+    """
+    global _last_timestamp
+    second = int(time.time())
+    cached_second, iso = _last_timestamp
+    if second != cached_second:
+        iso = datetime.fromtimestamp(second).isoformat(timespec='seconds')
+        _last_timestamp = (second, iso)
+    return iso
+
+
+class TTLCache:
+    """Thread-safe cache whose entries expire a fixed time after they are stored
+
+    Expired entries are dropped when they are looked up and whenever a value
+    is stored. With ``maxsize`` set, storing beyond that many entries evicts
+    the least recently used ones.
+    """
+
+    def __init__(self, ttl: float = 1.0, maxsize: Optional[int] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._key_locks = {}  # key -> (lock, number of callers holding or waiting on it)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or ``default`` if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value for ``ttl`` seconds (the cache default if not given)"""
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def _store(self, key, value, ttl):
+        """Store an entry, then drop expired and excess ones; called with the lock held"""
+        now = time.monotonic()
+        self._entries[key] = (now + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        for expired in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[expired]
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Get a cached value, calling ``factory`` to compute it when missing or expired
+
+        Concurrent callers for the same key wait for a single ``factory`` call
+        instead of each computing the value. A value computed while the cache
+        was being invalidated is returned but not stored.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            key_lock, users = self._key_locks.get(key, (None, 0))
+            if key_lock is None:
+                key_lock = threading.Lock()
+            self._key_locks[key] = (key_lock, users + 1)
+        try:
+            with key_lock:
+                value = self.get(key, _MISSING)
+                if value is _MISSING:
+                    generation = self._generation
+                    value = factory()
+                    with self._lock:
+                        if generation == self._generation:
+                            self._store(key, value, ttl)
+                return value
+        finally:
+            # The last caller for a key removes its lock
+            with self._lock:
+                key_lock, users = self._key_locks[key]
+                if users == 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (key_lock, users - 1)
+
+    def invalidate(self, key: Hashable = _MISSING) -> None:
+        """Drop one entry, or every entry when no key is given"""
+        with self._lock:
+            self._generation += 1
+            if key is _MISSING:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
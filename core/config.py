@@ -24,6 +24,9 @@ class Config:
         self.COMMAND_TIMEOUT = int(os.environ.get('COMMAND_TIMEOUT', 30))
         self.MAX_RETRIES = int(os.environ.get('MAX_RETRIES', 3))
         self.RETRY_DELAY = int(os.environ.get('RETRY_DELAY', 1))
+        self.PM2_LIST_CACHE_TTL = float(os.environ.get('PM2_LIST_CACHE_TTL', 1.0))  # seconds
+        self.LOG_PATHS_CACHE_TTL = float(os.environ.get('LOG_PATHS_CACHE_TTL', 60.0))  # seconds
+        self.LOG_RESPONSE_CACHE_TTL = float(os.environ.get('LOG_RESPONSE_CACHE_TTL', 1.0))  # seconds
         
         # File Paths
         self.PM2_CONFIG_DIR = Path('/home/pm2/pm2-configs')
@@ -38,6 +41,12 @@ class Config:
         # Monitoring settings
         self.MONITORING_RETENTION_DAYS = int(os.getenv('MONITORING_RETENTION_DAYS', 30))
         self.MONITORING_MAX_POINTS = int(os.getenv('MONITORING_MAX_POINTS', 10000))
+        self.MONITORING_RESPONSE_CACHE_TTL = float(os.getenv('MONITORING_RESPONSE_CACHE_TTL', 30.0))  # seconds
+        
+        # Response settings
+        self.GZIP_MIN_SIZE = int(os.getenv('GZIP_MIN_SIZE', 512))  # bytes
+        self.HEALTH_POLL_INTERVAL = int(os.getenv('HEALTH_POLL_INTERVAL', 5))  # seconds
+        self.HEALTH_PROBE_TIMEOUT = float(os.getenv('HEALTH_PROBE_TIMEOUT', 2.0))  # seconds
         
         self._create_required_directories()
     
@@ -2,18 +2,36 @@
 
 import sqlite3
 import threading
-import logging
-from typing import Callable
+
+# Start of the ``?``-second bucket a row's timestamp falls in, formatted like
+# the stored timestamps. Buckets are aligned to the epoch so a given interval
+# always yields the same boundaries.
+INTERVAL_START_SQL = "datetime(strftime('%s', timestamp) - strftime('%s', timestamp) % ?, 'unixepoch')"
+
+# Applied to read-only connections: refuse writes, keep a ~20 MB page cache
+# and memory-map up to 256 MB of the file so repeated reads stay hot
+READ_ONLY_PRAGMAS = (
+    'PRAGMA query_only=1',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA mmap_size=268435456'
+)
 
 class DatabaseConnection:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, read_only: bool = False):
         self.db_path = db_path
+        self.read_only = read_only
         self._local = threading.local()
 
     def get_connection(self) -> sqlite3.Connection:
         """Get a thread-local database connection"""
         if not hasattr(self._local, 'connection'):
-            self._local.connection = sqlite3.connect(self.db_path)
+            if self.read_only:
+                connection = sqlite3.connect(self.db_path, isolation_level=None)
+                for pragma in READ_ONLY_PRAGMAS:
+                    connection.execute(pragma)
+            else:
+                connection = sqlite3.connect(self.db_path)
+            self._local.connection = connection
         return self._local.connection
 
     def close_all(self):
@@ -98,6 +116,18 @@ def setup_database(config, logger) -> None:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_disk_metrics_timestamp ON disk_metrics(timestamp)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_network_metrics_timestamp ON network_metrics(timestamp)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_service_status_timestamp ON service_status(timestamp)')
+        # Per-process lookups filter on the name and a timestamp range and
+        # only read the columns below, so they never touch the table itself
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_svc_ts_cover ON service_status(
+                service_name, timestamp, cpu_usage, memory_usage, has_error, has_warning, status
+            )
+        ''')
+
+        # Refresh planner statistics, sampling each index instead of reading
+        # it whole so startup stays quick on a full database
+        cursor.execute('PRAGMA analysis_limit=1000')
+        cursor.execute('ANALYZE')
 
         # Create cleanup triggers
         retention_days = getattr(config, 'MONITORING_RETENTION_DAYS', 30)
@@ -1,11 +1,8 @@
 # core/scheduler.py
 
+import sqlite3
 import threading
-import time
 import logging
-import queue
-import signal
-from datetime import datetime
 from typing import Dict
 
 class MonitoringTask(threading.Thread):
@@ -3,7 +3,6 @@
 import psutil
 import platform
 import socket
-import os
 import sqlite3
 import threading
 import time
@@ -19,6 +18,7 @@ class MetricsCollector(threading.Thread):
         self.daemon = True
         self._stop_event = threading.Event()
         self._metrics_lock = threading.Lock()
+        self._sample_seq = 0
         self._latest_metrics = {
             'cpu_percent': 0,
             'per_cpu_percent': [],
@@ -35,12 +35,17 @@ class MetricsCollector(threading.Thread):
                     'memory': psutil.virtual_memory()._asdict(),
                     'load_average': psutil.getloadavg()
                 })
+                self._sample_seq += 1
             time.sleep(self.interval)
 
     def get_metrics(self) -> Dict:
         with self._metrics_lock:
             return self._latest_metrics.copy()
 
+    def get_sample_seq(self) -> int:
+        """Number of samples taken so far; changes whenever the metrics do"""
+        return self._sample_seq
+
     def stop(self):
         self._stop_event.set()
         self.join(timeout=2)  # Wait up to 2 seconds for the thread to stop
@@ -49,6 +54,7 @@ class HostMonitor:
     def __init__(self, config, logger: logging.Logger):
         self.config = config
         self.logger = logger
+        self.static_info = self._get_static_info()
         self.metrics_collector = MetricsCollector()
         self.metrics_collector.start()
 
@@ -132,17 +138,30 @@ class HostMonitor:
             if conn:
                 conn.close()
 
+    def _get_static_info(self) -> Dict:
+        """Collect host information that does not change while we run"""
+        return {
+            'hostname': socket.gethostname(),
+            'os': f"{platform.system()} {platform.release()}",
+            'kernel': platform.version(),
+            'arch': platform.machine(),
+            'boot_time': datetime.fromtimestamp(psutil.boot_time()),
+            'cores_physical': psutil.cpu_count(logical=False),
+            'cores_logical': psutil.cpu_count(logical=True)
+        }
+
     def get_host_details(self) -> Dict:
         """Get comprehensive host system information"""
+        static_info = self.static_info
         try:
             return {
                 'timestamp': datetime.now(),
-                'hostname': socket.gethostname(),
-                'os': f"{platform.system()} {platform.release()}",
-                'kernel': platform.version(),
-                'arch': platform.machine(),
+                'hostname': static_info['hostname'],
+                'os': static_info['os'],
+                'kernel': static_info['kernel'],
+                'arch': static_info['arch'],
                 'uptime': self.get_uptime(),
-                'boot_time': datetime.fromtimestamp(psutil.boot_time()),
+                'boot_time': static_info['boot_time'],
                 'cpu': self.get_cpu_info(),
                 'memory': self.get_memory_info(),
                 'disks': self.get_disk_info(),
@@ -154,9 +173,42 @@ class HostMonitor:
             self.logger.error(f"Error getting host details: {str(e)}")
             raise
 
+    def get_all_metrics(self) -> Dict:
+        """Get current host metrics for periodic monitoring non-blocking"""
+        current_metrics = self.metrics_collector.get_metrics()
+        memory = current_metrics['memory'] or psutil.virtual_memory()._asdict()
+        net_io = psutil.net_io_counters()
+
+        return {
+            'timestamp': datetime.now(),
+            'cpu_percent': current_metrics['cpu_percent'],
+            'memory_percent': memory['percent'],
+            'disk_usage': [
+                {
+                    'device': disk['device'],
+                    'mount_point': disk['mount_point'],
+                    'percent_used': disk['percent_used']
+                }
+                for disk in self.get_disk_info()
+            ],
+            'network_io': {
+                'bytes_sent': net_io.bytes_sent,
+                'bytes_recv': net_io.bytes_recv,
+                'packets_sent': net_io.packets_sent,
+                'packets_recv': net_io.packets_recv,
+                'errors_in': net_io.errin,
+                'errors_out': net_io.errout
+            },
+            'load_average': list(current_metrics['load_average'])
+        }
+
+    def get_sample_seq(self) -> int:
+        """Sequence number of the collector sample behind get_all_metrics()"""
+        return self.metrics_collector.get_sample_seq()
+
     def get_uptime(self) -> float:
         """Get system uptime in seconds"""
-        return (datetime.now() - datetime.fromtimestamp(psutil.boot_time())).total_seconds()
+        return (datetime.now() - self.static_info['boot_time']).total_seconds()
 
     def get_cpu_info(self) -> Dict:
         """Get detailed CPU information non-blocking"""
@@ -165,8 +217,8 @@ class HostMonitor:
         load_avg = current_metrics['load_average']
         
         return {
-            'cores_physical': psutil.cpu_count(logical=False),
-            'cores_logical': psutil.cpu_count(logical=True),
+            'cores_physical': self.static_info['cores_physical'],
+            'cores_logical': self.static_info['cores_logical'],
             'usage_percent': current_metrics['cpu_percent'],
             'per_cpu_percent': current_metrics['per_cpu_percent'],
             'load_avg_1m': load_avg[0],
@@ -184,14 +236,14 @@ class HostMonitor:
         swap = psutil.swap_memory()
         
         return {
-            'total': mem['total'] / (1024**3),  # Convert to GB
-            'available': mem['available'] / (1024**3),
-            'used': mem['used'] / (1024**3),
-            'free': mem['free'] / (1024**3),
+            'total': mem['total'],  # bytes
+            'available': mem['available'],
+            'used': mem['used'],
+            'free': mem['free'],
             'percent_used': mem['percent'],
-            'swap_total': swap.total / (1024**3),
-            'swap_used': swap.used / (1024**3),
-            'swap_free': swap.free / (1024**3),
+            'swap_total': swap.total,
+            'swap_used': swap.used,
+            'swap_free': swap.free,
             'swap_percent': swap.percent
         }
 
@@ -206,9 +258,9 @@ class HostMonitor:
                         'device': partition.device,
                         'mount_point': partition.mountpoint,
                         'fs_type': partition.fstype,
-                        'total_size': usage.total / (1024**3),  # Convert to GB
-                        'used': usage.used / (1024**3),
-                        'free': usage.free / (1024**3),
+                        'total_size': usage.total,  # bytes
+                        'used': usage.used,
+                        'free': usage.free,
                         'percent_used': usage.percent
                     })
             except (PermissionError, OSError):
@@ -1,6 +1,8 @@
 # services/log_manager.py
 
+import io
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional
 from collections import deque
@@ -8,13 +10,19 @@ from core.config import Config
 from core.exceptions import ProcessNotFoundError
 from services.pm2 import PM2Service
 
+# Size of each read when tailing a log file from its end
+TAIL_BLOCK_SIZE = 64 * 1024
+
 class LogManager:
     """Enhanced service for managing PM2 process logs"""
     
-    def __init__(self, config: Config, logger: logging.Logger):
+    def __init__(self, config: Config, logger: logging.Logger,
+                 pm2_service: Optional[PM2Service] = None):
         self.config = config
         self.logger = logger
-        self.pm2_service = PM2Service(config, logger)
+        # Share the application's PM2Service when given one instead of
+        # verifying the PM2 installation again for a private instance
+        self.pm2_service = pm2_service or PM2Service(config, logger)
     
     def _read_log_file(self, file_path: Path, num_lines: int) -> List[str]:
         """Read the last N lines from a log file"""
@@ -22,10 +30,32 @@ class LogManager:
             if not file_path or not Path(file_path).exists():
                 return [f"Log file not found: {file_path}"]
                 
-            with open(file_path, 'r') as f:
+            # Read blocks backwards from the end until they hold more than
+            # num_lines newlines, so only the tail of a large log is read
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                pos = os.fstat(fd).st_size
+                blocks = []
+                newlines = 0
+                while pos > 0 and newlines <= num_lines:
+                    size = min(TAIL_BLOCK_SIZE, pos)
+                    pos -= size
+                    block = os.pread(fd, size, pos)
+                    blocks.append(block)
+                    newlines += block.count(b'\n')
+            finally:
+                os.close(fd)
+
+            data = b''.join(reversed(blocks))
+            if pos > 0:
+                # Drop the partial line the first block started in
+                data = data[data.index(b'\n') + 1:]
+
+            # Decode like open(file_path, 'r') would, universal newlines included
+            with io.TextIOWrapper(io.BytesIO(data)) as f:
                 return list(deque(f, num_lines))
         except Exception as e:
-            self.logger.error(f"Error reading log file {file_path}: {str(e)}")
+            self.logger.error("Error reading log file %s: %s", file_path, e)
             return [f"Error reading log: {str(e)}"]
     
     def get_process_logs_by_type(self, process_name: str, log_type: str, 
@@ -72,7 +102,7 @@ class LogManager:
             }
             
         except Exception as e:
-            self.logger.error(f"Error getting {log_type} logs for {process_name}: {str(e)}")
+            self.logger.error("Error getting %s logs for %s: %s", log_type, process_name, e)
             raise
     
     def clear_process_logs(self, process_name: str) -> Dict:
@@ -113,5 +143,5 @@ class LogManager:
         except ProcessNotFoundError:
             raise
         except Exception as e:
-            self.logger.error(f"Error clearing logs for {process_name}: {str(e)}")
+            self.logger.error("Error clearing logs for %s: %s", process_name, e)
             raise
\ No newline at end of file
@@ -7,6 +7,7 @@ import logging
 from typing import Dict
 from pathlib import Path
 from core.exceptions import PM2CommandError, ProcessNotFoundError
+from .service import invalidate_process_list
 
 class PM2Commands:
     """Handles PM2 command execution and retry logic"""
@@ -22,13 +23,17 @@ class PM2Commands:
         
         for attempt in range(retries):
             try:
-                result = subprocess.run(
-                    f"{self.config.PM2_BIN} {command}",
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=self.config.COMMAND_TIMEOUT
-                )
+                try:
+                    result = subprocess.run(
+                        f"{self.config.PM2_BIN} {command}",
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=self.config.COMMAND_TIMEOUT
+                    )
+                finally:
+                    if 'jlist' not in command:
+                        invalidate_process_list()
                 
                 if result.returncode != 0:
                     raise subprocess.CalledProcessError(
@@ -1,7 +1,7 @@
 # services/pm2/config.py
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict
 
 class PM2Config:
     def __init__(self, logger: logging.Logger):
@@ -0,0 +1,51 @@
+# services/pm2/runner.py
+import asyncio
+import threading
+from typing import Sequence, Tuple
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared event loop, starting its thread on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='pm2-runner', daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+async def _run(argv: Sequence[str], timeout: float) -> Tuple[int, str, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        # asyncio.TimeoutError is only an alias of the builtin from Python 3.11
+        raise TimeoutError(f"{argv[0]} did not finish within {timeout} seconds")
+    return proc.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
+
+def run_pm2(argv: Sequence[str], timeout: float) -> Tuple[int, str, str]:
+    """Run a command on the shared event loop thread and wait for it
+
+    The calling thread only blocks on a future while the subprocess is
+    driven by the loop, so many commands can be in flight without a
+    thread each waiting in subprocess.run.
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+
+    Raises:
+        TimeoutError: If the command runs longer than ``timeout`` seconds
+    """
+    future = asyncio.run_coroutine_threadsafe(_run(argv, timeout), _get_loop())
+    return future.result()
@@ -1,13 +1,24 @@
 # services/pm2/service.py
 import subprocess
 import json
-import time
 import logging
+import shlex
 from pathlib import Path
 from typing import List, Dict, Optional
+from core.cache import TTLCache
 from core.config import Config
 from core.exceptions import PM2Error, ProcessNotFoundError
 from .config import PM2Config
+from .runner import run_pm2
+
+# Raw `pm2 jlist` output shared by every PM2Service, keyed by PM2 binary
+_process_list_cache = TTLCache()
+
+
+def invalidate_process_list():
+    """Drop cached process lists after a command that may have changed PM2 state"""
+    _process_list_cache.invalidate()
+
 
 class PM2Service:
     """Service for interacting with PM2 process manager with improved error handling"""
@@ -62,29 +73,27 @@ class PM2Service:
             raise PM2Error(f"Config generation failed: {str(e)}")
     
     def list_processes(self) -> List[Dict]:
-        """Get list of all PM2 processes with improved error handling"""
+        """Get list of all PM2 processes with improved error handling
+
+        The `pm2 jlist` output is reused for PM2_LIST_CACHE_TTL seconds, and
+        concurrent callers share one subprocess. Each call parses its own copy,
+        so callers may modify the returned process dicts.
+        """
         try:
-            result = subprocess.run(
-                f"{self.config.PM2_BIN} jlist",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=self.config.COMMAND_TIMEOUT
+            output = _process_list_cache.get_or_set(
+                self.config.PM2_BIN,
+                self._run_jlist,
+                self.config.PM2_LIST_CACHE_TTL
             )
             
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() or "Unknown error"
-                self.logger.error(f"PM2 list processes failed: {error_msg}")
-                raise PM2Error(f"Failed to list processes: {error_msg}")
-            
             try:
-                processes = json.loads(result.stdout)
+                processes = json.loads(output)
                 return processes
             except json.JSONDecodeError as e:
                 self.logger.error(f"Failed to parse PM2 process list: {str(e)}")
                 raise PM2Error(f"Invalid PM2 process list format: {str(e)}")
                 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             error_msg = f"PM2 command timed out after {self.config.COMMAND_TIMEOUT} seconds"
             self.logger.error(error_msg)
             raise PM2Error(error_msg)
@@ -93,6 +102,22 @@ class PM2Service:
             self.logger.error(f"Unexpected error listing processes: {str(e)}")
             raise PM2Error(f"Failed to list processes: {str(e)}")
             
+    def _run_jlist(self) -> str:
+        """Run `pm2 jlist` on the shared runner loop and return its raw output"""
+        argv = [*shlex.split(self.config.PM2_BIN), 'jlist']
+        returncode, stdout, stderr = run_pm2(argv, self.config.COMMAND_TIMEOUT)
+        
+        if returncode != 0:
+            error_msg = stderr.strip() or "Unknown error"
+            self.logger.error(f"PM2 list processes failed: {error_msg}")
+            raise PM2Error(f"Failed to list processes: {error_msg}")
+        
+        return stdout
+
+    def invalidate_process_list(self):
+        """Make the next list_processes() call query PM2 again"""
+        invalidate_process_list()
+            
     def get_process(self, name: str) -> Dict:
         """Get details of a specific process with improved error handling"""
         try:
@@ -116,13 +141,16 @@ class PM2Service:
             timeout = timeout or self.config.COMMAND_TIMEOUT
             self.logger.debug(f"Running PM2 command: {cmd}")
             
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            try:
+                result = subprocess.run(
+                    cmd,
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+            finally:
+                invalidate_process_list()
             
             # Log command output for debugging
             if result.stdout:
@@ -150,6 +178,51 @@ class PM2Service:
             self.logger.error(f"Command execution failed: {str(e)}")
             raise PM2Error(f"Command failed: {str(e)}")
 
+    def _run_action(self, action: str, name: str) -> Dict:
+        """Run `pm2 <action> <name>` for an existing process on the shared runner loop"""
+        self.get_process(name)
+        argv = [*shlex.split(self.config.PM2_BIN), action, name]
+        self.logger.debug(f"Running PM2 command: {shlex.join(argv)}")
+        
+        try:
+            returncode, stdout, stderr = run_pm2(argv, self.config.COMMAND_TIMEOUT)
+        except TimeoutError:
+            error_msg = f"Command timed out after {self.config.COMMAND_TIMEOUT} seconds"
+            self.logger.error(error_msg)
+            raise PM2Error(error_msg)
+        except OSError as e:
+            self.logger.error(f"Command execution failed: {str(e)}")
+            raise PM2Error(f"Command failed: {str(e)}")
+        finally:
+            invalidate_process_list()
+        
+        if returncode != 0:
+            error_msg = stderr.strip() or "Unknown error"
+            self.logger.error(f"PM2 {action} {name} failed: {error_msg}")
+            raise PM2Error(f"Failed to {action} process {name}: {error_msg}")
+        
+        return {
+            'success': True,
+            'output': stdout.strip(),
+            'command': shlex.join(argv)
+        }
+
+    def start_process(self, name: str) -> Dict:
+        """Start a process"""
+        return self._run_action('start', name)
+
+    def stop_process(self, name: str) -> Dict:
+        """Stop a process"""
+        return self._run_action('stop', name)
+
+    def restart_process(self, name: str) -> Dict:
+        """Restart a process"""
+        return self._run_action('restart', name)
+
+    def delete_process(self, name: str) -> Dict:
+        """Delete a process from PM2"""
+        return self._run_action('delete', name)
+
     def deploy_process(self, process_name: str, action: str = "update") -> Dict:
         """Deploy or update a process using PM2 deploy command
         
@@ -1,4 +1,5 @@
 # services/process/__init__.py
+from .env import EnvConfig, DEFAULT_ENV
 from .manager import ProcessManager
 
-__all__ = ['ProcessManager']
\ No newline at end of file
+__all__ = ['EnvConfig', 'DEFAULT_ENV', 'ProcessManager']
\ No newline at end of file
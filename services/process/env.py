@@ -0,0 +1,22 @@
+# services/process/env.py
+from dataclasses import asdict, dataclass
+from typing import Dict
+
+@dataclass(slots=True, frozen=True)
+class EnvConfig:
+    """Environment variables written into a new process's PM2 config"""
+    PORT: str = '5001'
+    HOST: str = '0.0.0.0'
+    DEBUG: str = 'False'
+    LOG_LEVEL: str = 'DEBUG'
+    PM2_BIN: str = 'pm2'
+    MAX_LOG_LINES: str = '1000'
+    COMMAND_TIMEOUT: str = '120'
+    MAX_RETRIES: str = '3'
+    RETRY_DELAY: str = '1'
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return the variables as a plain dict for the config template"""
+        return asdict(self)
+
+DEFAULT_ENV = EnvConfig()
\ No newline at end of file
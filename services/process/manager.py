@@ -1,9 +1,11 @@
 # services/process/manager.py
 import json
 import os
+import re
 import shutil
 import logging
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 import sqlite3
@@ -13,9 +15,17 @@ from core.config import Config
 from core.exceptions import (
     PM2CommandError,
     ProcessNotFoundError,
-    ProcessAlreadyExistsError,
 )
 from services.pm2 import PM2Service, PM2Commands
+from .env import DEFAULT_ENV
+
+
+@lru_cache(maxsize=128)
+def _read_config_file(path: str, mtime_ns: int) -> str:
+    """Read a process config file, reusing the content until its mtime changes"""
+    with open(path, 'r') as f:
+        return f.read()
+
 
 class ProcessManager:
     def __init__(self, config: Config, logger: logging.Logger):
@@ -84,17 +94,7 @@ class ProcessManager:
     const max_restarts = `{config_data.get('max_restarts', '3')}`;
     const watch = `{config_data.get('watch', 'False')}`;
     const max_memory_restart = `{config_data.get('max_memory_restart', '1G')}`;
-    const envConfig = {json.dumps(config_data.get('env_vars', {
-        'PORT': '5001',
-        'HOST': '0.0.0.0',
-        'DEBUG': 'False',
-        'LOG_LEVEL': 'DEBUG',
-        'PM2_BIN': 'pm2',
-        'MAX_LOG_LINES': '1000',
-        'COMMAND_TIMEOUT': '120',
-        'MAX_RETRIES': '3',
-        'RETRY_DELAY': '1'
-    }), indent=4)};
+    const envConfig = {json.dumps(config_data.get('env_vars', DEFAULT_ENV.as_dict()), indent=4)};
 
     // Static Configuration
     const baseFolder = `/home/pm2/pm2-processes/${{processName}}`;
@@ -173,6 +173,7 @@ class ProcessManager:
                     stderr=subprocess.PIPE,
                     start_new_session=True
                 )
+                self.pm2_service.invalidate_process_list()
 
                 self.logger.info(f"Process {name} created successfully")
                 return {
@@ -280,11 +281,12 @@ class ProcessManager:
             self.logger.debug(f"Getting config for process: {name}")
             config_path = Path(f"/home/pm2/pm2-configs/{name}.config.js")
             
-            if not config_path.exists():
+            try:
+                mtime_ns = config_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 raise ProcessNotFoundError(f"Config file not found for process {name}")
             
-            with open(config_path, 'r') as f:
-                config_content = f.read()
+            config_content = _read_config_file(str(config_path), mtime_ns)
                 
             self.logger.debug(f"Retrieved config for process {name}")
             return {
@@ -405,6 +407,8 @@ class ProcessManager:
         except Exception as e:
             self.logger.error(f"Failed to update process {name}: {str(e)}", exc_info=True)
             raise PM2CommandError(f"Process update failed: {str(e)}")
+        finally:
+            self.pm2_service.invalidate_process_list()
     
     def update_config(self, name: str, config_data: Dict) -> Dict:
         """Update process configuration by modifying specific configurations
@@ -545,6 +549,8 @@ class ProcessManager:
         except Exception as e:
             self.logger.error(f"Failed to update config for {name}: {str(e)}", exc_info=True)
             raise PM2CommandError(f"Config update failed: {str(e)}")
+        finally:
+            self.pm2_service.invalidate_process_list()
         
     def log_status(self):
         """Log current status of PM2 processes"""
@@ -0,0 +1,88 @@
+# tests/conftest.py
+
+import logging
+import os
+import sqlite3
+import sys
+import types
+
+import pytest
+from flask import Flask
+from flask_restx import Api
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.converters import init_url_converters
+from api.models._common import ModelRegistry
+from api.models.error import create_error_models
+from api.models.monitoring import create_monitoring_models
+from api.representations import output_json
+from core.database import setup_database
+
+
+class FakePM2Service:
+    """Stands in for PM2Service with a single online process"""
+
+    def get_process(self, name):
+        return {
+            'pid': 1,
+            'name': name,
+            'pm_id': 0,
+            'monit': {'cpu': 1.0, 'memory': 1024},
+            'pm2_env': {'status': 'online', 'created_at': 0}
+        }
+
+
+@pytest.fixture
+def config(tmp_path):
+    return types.SimpleNamespace(
+        DB_PATH=str(tmp_path / 'monitoring.db'),
+        MONITORING_RETENTION_DAYS=30,
+        MONITORING_MAX_POINTS=10000,
+        MONITORING_RESPONSE_CACHE_TTL=30.0,
+        GZIP_MIN_SIZE=512
+    )
+
+
+@pytest.fixture
+def db(config):
+    """Set up the monitoring database and return a function inserting service_status rows"""
+    setup_database(config, logging.getLogger(__name__))
+
+    def insert(rows):
+        conn = sqlite3.connect(config.DB_PATH)
+        try:
+            conn.executemany('''
+                INSERT INTO service_status
+                (service_name, timestamp, status, cpu_usage, memory_usage, has_error, has_warning)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+    return insert
+
+
+@pytest.fixture
+def monitoring_app(config, db):
+    """Flask app with the monitoring routes registered the way app.py does"""
+    from api.routes.monitoring import create_monitoring_routes
+
+    app = Flask(__name__)
+    init_url_converters(app)
+    api = Api(app, prefix='/api')
+    api.representations['application/json'] = output_json
+    api.models = ModelRegistry(api.models)
+    api.models.add_lazy(create_monitoring_models(api))
+    api.models['error'] = create_error_models(api)
+
+    namespace = api.namespace('monitoring')
+    namespace.models = api.models
+    create_monitoring_routes(namespace, {
+        'pm2_service': FakePM2Service(),
+        'logger': logging.getLogger(__name__),
+        'config': config
+    })
+    app.api = api
+    return app
@@ -0,0 +1,61 @@
+# tests/test_compression.py
+
+import gzip
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.compression import init_response_compression
+
+HEATMAP_URL = '/api/monitoring/processes/app/heatmap?period=2&interval=1'
+
+
+@pytest.fixture
+def client(monitoring_app, config, db):
+    init_response_compression(monitoring_app, config)
+    now = datetime.now()
+    db([
+        ('app', (now - timedelta(minutes=minutes)).strftime('%Y-%m-%d %H:%M:%S'), 1, 50.0, 100.0, 0, 0)
+        for minutes in range(60)
+    ])
+    return monitoring_app.test_client()
+
+
+def test_matching_etag_is_answered_with_304(client):
+    response = client.get(HEATMAP_URL)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+
+    revalidated = client.get(HEATMAP_URL, headers={'If-None-Match': etag})
+
+    assert revalidated.status_code == 304
+    assert revalidated.data == b''
+
+
+def test_large_bodies_are_gzipped_for_clients_that_accept_it(client):
+    plain = client.get(HEATMAP_URL)
+    compressed = client.get(HEATMAP_URL, headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in plain.headers
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    assert gzip.decompress(compressed.data) == plain.data
+
+
+def test_small_bodies_are_not_gzipped(client):
+    response = client.get('/api/monitoring/processes/idle/heatmap', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 200
+    assert len(response.data) < 512
+    assert 'ETag' in response.headers
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_other_endpoints_are_left_alone(client):
+    response = client.get('/api/monitoring/processes/app/monitoring', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 200
+    assert len(response.data) >= 512
+    assert 'ETag' not in response.headers
+    assert 'Content-Encoding' not in response.headers
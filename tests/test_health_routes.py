@@ -0,0 +1,105 @@
+# tests/test_health_routes.py
+
+import logging
+import time
+import types
+
+import pytest
+from flask import Flask
+from flask_restx import Api
+
+from api.models._common import ModelRegistry
+from api.models.health import create_health_models
+from api.representations import output_json
+from api.routes.health import create_health_routes
+
+
+class SlowPM2Service:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def list_processes(self):
+        time.sleep(self.delay)
+        return [{'pm2_env': {'status': 'online'}}, {'pm2_env': {'status': 'stopped'}}]
+
+
+@pytest.fixture
+def health_client():
+    pollers = []
+
+    def make(pm2_service, poll_interval=0.1, probe_timeout=0.5):
+        client, poller = _health_client(pm2_service, poll_interval, probe_timeout)
+        pollers.append(poller)
+        return client
+
+    yield make
+    for poller in pollers:
+        poller.stop()
+
+
+def _health_client(pm2_service, poll_interval, probe_timeout):
+    app = Flask(__name__)
+    api = Api(app, prefix='/api')
+    api.representations['application/json'] = output_json
+    api.models = ModelRegistry(api.models)
+    api.models.add_lazy(create_health_models(api))
+    namespace = api.namespace('health')
+    namespace.models = api.models
+    poller = create_health_routes(namespace, {
+        'pm2_service': pm2_service,
+        'logger': logging.getLogger(__name__),
+        'config': types.SimpleNamespace(HEALTH_POLL_INTERVAL=poll_interval, HEALTH_PROBE_TIMEOUT=probe_timeout)
+    })
+    return app.test_client(), poller
+
+
+def _wait_until_healthy(client, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get('/api/health')
+        if response.status_code == 200:
+            return response
+        time.sleep(0.01)
+    raise AssertionError('health check never became healthy')
+
+
+def test_health_poller_starts_with_first_request(health_client):
+    client = health_client(SlowPM2Service(delay=0.05))
+
+    first = client.get('/api/health')
+
+    assert first.status_code == 503
+    assert first.get_json()['pm2_status'] == 'starting'
+    assert first.headers['X-Cache'] == 'MISS'
+
+    response = _wait_until_healthy(client)
+    assert response.get_json()['processes'] == 1
+    assert response.headers['X-Cache'] == 'HIT'
+
+
+def test_unresponsive_health_check_is_not_a_cache_hit(health_client):
+    client = health_client(SlowPM2Service(delay=5), poll_interval=0.05, probe_timeout=0.05)
+
+    client.get('/api/health')
+    time.sleep(0.15)
+    response = client.get('/api/health')
+
+    assert response.status_code == 503
+    assert response.get_json()['pm2_status'] == 'unresponsive'
+    assert response.headers['X-Cache'] == 'MISS'
+
+
+def test_stopped_poller_restarts_on_next_request():
+    client, poller = _health_client(SlowPM2Service(delay=0), poll_interval=0.05, probe_timeout=0.5)
+    try:
+        _wait_until_healthy(client)
+        task = poller._task
+
+        poller.stop()
+        task.join(timeout=1)
+
+        assert not task.is_alive()
+        _wait_until_healthy(client)
+        assert poller._task is not task
+    finally:
+        poller.stop()
@@ -0,0 +1,27 @@
+# tests/test_models.py
+
+import pytest
+from flask_restx import fields
+
+from api.models._common import CachedModel
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda model: model.__setitem__('added', fields.Integer()),
+    lambda model: model.update(added=fields.Integer()),
+    lambda model: model.setdefault('added', fields.Integer()),
+    lambda model: model.__ior__({'added': fields.Integer()}),
+    lambda model: model.pop('name'),
+    lambda model: model.popitem(),
+    lambda model: model.__delitem__('name'),
+    lambda model: model.clear()
+])
+def test_cached_model_drops_cached_values_on_mutation(mutate):
+    model = CachedModel('Cached', {'name': fields.String()})
+    assert model.resolved is model.resolved
+    assert model._schema is model._schema
+
+    mutate(model)
+
+    assert set(model.resolved) == set(model)
+    assert set(model._schema.get('properties', {})) == set(model)
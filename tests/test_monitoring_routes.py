@@ -0,0 +1,167 @@
+# tests/test_monitoring_routes.py
+
+from datetime import datetime, timedelta
+
+
+def test_process_monitoring_metrics(monitoring_app, db):
+    now = datetime.now().replace(second=5, microsecond=0)
+    _minutes_ago = lambda minutes: (now - timedelta(minutes=minutes)).strftime('%Y-%m-%d %H:%M:%S')
+    db([
+        ('app', _minutes_ago(10), 1, 20.0, 100.0, 0, 0),
+        ('app', _minutes_ago(10), 1, 40.0, 300.0, 0, 1),
+        ('app', _minutes_ago(5), 1, 95.0, 200.0, 0, 0),
+        ('app', _minutes_ago(3), 0, 10.0, 50.0, 0, 0),
+        ('app', _minutes_ago(2), 1, 10.0, 50.0, 1, 0),
+        ('other', _minutes_ago(4), 1, 99.0, 1.0, 1, 1)
+    ])
+
+    response = monitoring_app.test_client().get('/api/monitoring/processes/app/monitoring?timeframe=30')
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['process_name'] == 'app'
+    assert body['time_range'] == 'Last 30 minutes'
+
+    metrics = body['metrics']
+    assert len(metrics['timestamps']) in (30, 31)
+    assert all(len(metrics[key]) == len(metrics['timestamps']) for key in metrics)
+    points = dict(zip(metrics['timestamps'], zip(metrics['cpu'], metrics['memory'], metrics['warnings'], metrics['status'])))
+    minute = lambda minutes: _minutes_ago(minutes)[:-2] + '00'
+    assert points[minute(10)] == (30.0, 200.0, 1, 'green')
+    assert points[minute(5)] == (95.0, 200.0, 0, 'red')
+    assert points[minute(3)] == (10.0, 50.0, 0, 'gray')
+    assert points[minute(2)] == (10.0, 50.0, 0, 'red')
+    assert points[minute(20)] == (0.0, 0.0, 0, 'green')
+
+    summary = body['summary']
+    assert summary['cpu']['max'] == 95.0
+    assert summary['errors'] == 1
+    assert summary['warnings'] == 1
+    assert sum(summary['status_distribution'].values()) == len(metrics['timestamps'])
+    assert summary['status_distribution']['red'] == 2
+
+
+def test_process_monitoring_rejects_invalid_interval(monitoring_app, db):
+    client = monitoring_app.test_client()
+
+    assert client.get('/api/monitoring/processes/app/monitoring?interval=0').status_code == 400
+    assert client.get('/api/monitoring/processes/app/monitoring?timeframe=100000&interval=1').status_code == 400
+
+
+def test_process_routes_reject_malformed_names(monitoring_app):
+    client = monitoring_app.test_client()
+
+    assert client.get('/api/monitoring/processes/bad%20name/monitoring').status_code == 404
+    assert client.get('/api/monitoring/processes/' + 'a' * 65 + '/status').status_code == 404
+
+
+def test_process_monitoring_grid_is_epoch_aligned(monitoring_app, db):
+    now = datetime.now().replace(microsecond=0)
+    epoch = datetime(1970, 1, 1)
+    # Start of the five-minute interval ten intervals before the current one
+    bucket = now - timedelta(seconds=(now - epoch).total_seconds() % 300) - timedelta(minutes=50)
+    _at = lambda moment: moment.strftime('%Y-%m-%d %H:%M:%S')
+    db([
+        ('app', _at(bucket + timedelta(seconds=10)), 1, 10.0, 100.0, 0, 0),
+        ('app', _at(bucket + timedelta(seconds=299)), 1, 30.0, 300.0, 0, 0),
+        ('app', _at(bucket + timedelta(seconds=300)), 1, 80.0, 50.0, 0, 1)
+    ])
+
+    response = monitoring_app.test_client().get('/api/monitoring/processes/app/monitoring?timeframe=120&interval=300')
+
+    assert response.status_code == 200
+    metrics = response.get_json()['metrics']
+    timestamps = [datetime.fromisoformat(timestamp) for timestamp in metrics['timestamps']]
+    assert all((timestamp - epoch).total_seconds() % 300 == 0 for timestamp in timestamps)
+    assert all(later - earlier == timedelta(minutes=5) for earlier, later in zip(timestamps, timestamps[1:]))
+    assert timestamps[0] <= now - timedelta(minutes=120) < timestamps[0] + timedelta(minutes=5)
+    assert timestamps[-1] <= now < timestamps[-1] + timedelta(minutes=5)
+
+    points = dict(zip(timestamps, zip(metrics['cpu'], metrics['memory'], metrics['warnings'], metrics['status'])))
+    assert points[bucket] == (20.0, 200.0, 0, 'green')
+    assert points[bucket + timedelta(minutes=5)] == (80.0, 50.0, 1, 'orange')
+    assert points[bucket - timedelta(minutes=5)] == (0.0, 0.0, 0, 'green')
+    assert points[bucket + timedelta(minutes=10)] == (0.0, 0.0, 0, 'green')
+
+
+def _process_monitoring(app):
+    """A ProcessMonitoring resource from the app's registered monitoring route"""
+    resource = app.view_functions['monitoring_process_monitoring'].view_class
+    return resource(api=app.api)
+
+
+def test_metrics_summary(monitoring_app):
+    summary = _process_monitoring(monitoring_app).calculate_metrics_summary({
+        'timestamps': ['t0', 't1', 't2', 't3'],
+        'cpu': [10.0, 20.0, 30.0, 100.0],
+        'memory': [100.0, 0.0, 50.0, 250.0],
+        'errors': [0, 2, 0, 1],
+        'warnings': [1, 0, 0, 0],
+        'status': ['green', 'red', 'green', 'gray']
+    })
+
+    assert summary == {
+        'cpu': {'avg': 40.0, 'max': 100.0, 'min': 10.0},
+        'memory': {'avg': 100.0, 'max': 250.0, 'min': 0.0},
+        'errors': 3,
+        'warnings': 1,
+        'status_distribution': {'green': 2, 'red': 1, 'gray': 1}
+    }
+
+
+def test_metrics_summary_without_data(monitoring_app):
+    empty = {'timestamps': [], 'cpu': [], 'memory': [], 'errors': [], 'warnings': [], 'status': []}
+
+    assert _process_monitoring(monitoring_app).calculate_metrics_summary(empty) == {
+        'error': 'No metrics data available'
+    }
+
+
+def test_process_monitoring_matches_marshalled_output(monitoring_app, db, monkeypatch):
+    from flask_restx import marshal
+    from api.representations import output_json
+    import api.routes.monitoring as monitoring
+
+    db([('app', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 1, 33.3, 123.4, 0, 1)])
+    payloads = []
+
+    def capture(payload, *args):
+        payloads.append(payload)
+        return json_response(payload, *args)
+
+    json_response = monitoring.json_response
+    monkeypatch.setattr(monitoring, 'json_response', capture)
+
+    response = monitoring_app.test_client().get('/api/monitoring/processes/app/monitoring?timeframe=5')
+
+    assert response.status_code == 200
+    with monitoring_app.test_request_context():
+        model = monitoring_app.api.models['metrics']
+        expected = output_json(marshal(payloads[0], model), 200)
+    assert response.data == expected.data
+
+
+def test_historical_requests_within_a_minute_share_a_cache_entry(monitoring_app, db):
+    client = monitoring_app.test_client()
+    url = '/api/monitoring/processes/app/historical?start=2001-01-01T00:00:00&end=2001-01-02T00:00:'
+
+    first = client.get(url + '10')
+    second = client.get(url + '45.5')
+
+    assert (first.status_code, second.status_code) == (200, 200)
+    assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('MISS', 'HIT')
+    assert second.get_json()['end_time'] == '2001-01-02T00:00:59'
+
+
+def test_historical_range_keeps_the_partial_end_minute(monitoring_app, db):
+    minute = datetime.now().replace(second=0, microsecond=0) - timedelta(minutes=5)
+    db([('app', (minute + timedelta(seconds=30)).strftime('%Y-%m-%d %H:%M:%S'), 1, 20.0, 100.0, 0, 0)])
+
+    response = monitoring_app.test_client().get('/api/monitoring/processes/app/historical', query_string={
+        'start': (minute - timedelta(hours=1)).isoformat(),
+        'end': (minute + timedelta(seconds=10)).isoformat(),
+        'interval': 1
+    })
+
+    assert response.status_code == 200
+    assert response.get_json()['metrics']['cpu']['avg'] == [20.0]
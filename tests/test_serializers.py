@@ -0,0 +1,132 @@
+# tests/test_serializers.py
+
+import random
+from datetime import date, datetime
+
+import pytest
+from flask import Flask
+from flask_restx import Api, Resource, fields, marshal
+
+from api.models._common import EpochMillis, ModelRegistry
+from api.models.error import create_error_models
+from api.models.health import create_health_models
+from api.models.host import create_host_models
+from api.models.logs import create_log_models
+from api.models.monitoring import create_monitoring_models
+from api.models.process import create_api_models
+from api.models.serializers import fast_serializer, marshal_fast
+from api.representations import encode_json, json_response, output_json
+
+
+def _build_api():
+    """An Api with every model factory registered the way app.py does"""
+    app = Flask(__name__)
+    api = Api(app, prefix='/api')
+    api.models = ModelRegistry(api.models)
+    api.models.add_lazy(create_api_models(api))
+    api.models.add_lazy(create_monitoring_models(api))
+    api.models.add_lazy(create_host_models(api))
+    api.models.add_lazy(create_health_models(api))
+    api.models.add_lazy(create_log_models(api))
+    api.models['error'] = create_error_models(api)
+    return app, api
+
+
+APP, API = _build_api()
+MODEL_KEYS = sorted([key for key, (_, model_key) in API.models.lazy.items() if key == model_key] + ['error'])
+
+
+def _reads_dict_attribute(key):
+    """Whether marshal reads a missing ``key`` as a dict attribute, e.g. ``values``"""
+    return hasattr(dict, key)
+
+
+def _sample_value(field, rng, depth):
+    field = field() if isinstance(field, type) else field
+    if isinstance(field, fields.Nested):
+        return _sample(field.nested, rng, depth + 1)
+    if isinstance(field, fields.List):
+        return [_sample_value(field.container, rng, depth + 1) for _ in range(rng.randrange(3))]
+    if isinstance(field, EpochMillis):
+        return rng.choice([datetime(2024, 1, 2, 3, 4, 5, 123456), '2024-01-02 03:04:05', 1704164645123])
+    if isinstance(field, fields.DateTime):
+        return rng.choice([datetime(2024, 1, 2, 3, 4, 5, 123456), datetime(2024, 1, 2), date(2024, 1, 2)])
+    if isinstance(field, fields.Boolean):
+        return rng.choice([True, False, 0, 1])
+    if isinstance(field, fields.Integer):
+        return rng.choice([0, 7, '7', 2.0])
+    if isinstance(field, fields.Float):
+        return rng.choice([0, 2.5, '2.5', 7])
+    if isinstance(field, fields.String):
+        return rng.choice(['text', 3, ''])
+    return rng.choice(['raw', 3, {'nested': [1, 2]}, [1, 'a']])
+
+
+def _sample(model, rng, depth=0):
+    """A payload for ``model`` with some fields missing, some None and the rest of varied types"""
+    if depth > 3:
+        return None
+    payload = {}
+    for key, field in model.resolved.items():
+        roll = rng.random()
+        if roll < 0.15 and not _reads_dict_attribute(key):
+            continue
+        payload[key] = None if roll < 0.3 else _sample_value(field, rng, depth)
+    return payload
+
+
+@pytest.mark.parametrize('key', MODEL_KEYS)
+def test_compiled_serializer_matches_marshal(key):
+    rng = random.Random(key)
+    with APP.app_context():
+        model = API.models[key]
+        serialize = fast_serializer(model)
+        payloads = [_sample(model, rng) for _ in range(50)]
+        if not any(_reads_dict_attribute(field) for field in model):
+            payloads += [None, {}]
+        for payload in payloads:
+            assert encode_json(serialize(payload)) == encode_json(marshal(payload, model)), payload
+
+
+def _masked_app():
+    """An app with one marshal_fast route returning a dict and one returning a ready Response"""
+    app = Flask(__name__)
+    api = Api(app, prefix='/api')
+    api.representations['application/json'] = output_json
+    namespace = api.namespace('masked')
+    model = namespace.model('Masked', {
+        'name': fields.String,
+        'count': fields.Integer,
+        'nested': fields.Nested(namespace.model('MaskedNested', {'a': fields.Integer, 'b': fields.Integer}))
+    })
+    payload = {'name': 'app', 'count': '3', 'nested': {'a': 1, 'b': 2}}
+
+    @namespace.route('/data')
+    class Data(Resource):
+        @marshal_fast(namespace, model)
+        def get(self):
+            return payload
+
+    @namespace.route('/response')
+    class Ready(Resource):
+        @marshal_fast(namespace, model)
+        def get(self):
+            return json_response({**payload, 'count': 3})
+
+    return app
+
+
+@pytest.mark.parametrize('path', ['/api/masked/data', '/api/masked/response'])
+def test_marshal_fast_applies_the_request_mask(path):
+    client = _masked_app().test_client()
+
+    assert client.get(path).get_json() == {'name': 'app', 'count': 3, 'nested': {'a': 1, 'b': 2}}
+    masked = client.get(path, headers={'X-Fields': 'count,nested{b}'})
+    assert masked.get_json() == {'count': 3, 'nested': {'b': 2}}
+
+
+def test_marshal_fast_documents_the_mask_header():
+    spec = _masked_app().test_client().get('/api/swagger.json').get_json()
+
+    parameters = spec['paths']['/masked/data']['get']['parameters']
+    assert {'name': 'X-Fields', 'in': 'header', 'type': 'string', 'format': 'mask', 'description': 'An optional fields mask'} in parameters